@@ -0,0 +1,106 @@
+"""Benchmark building the admin email DataFrame
+
+Compares the old per-row loop (one pd.to_datetime call per email) with
+the vectorized read_sql_query path used by the Admin Panel.
+
+    python benchmarks/bench_dataframe.py
+    python benchmarks/bench_dataframe.py --rows 10000 100000
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database
+from database import set_database_path
+from emails import get_all_emails_dataframe
+from migrations import run_migrations
+
+
+def create_dataset(path, rows):
+    """Fill a fresh user_emails table with synthetic signups, then migrate it"""
+    conn = sqlite3.connect(path)
+    conn.execute('''
+        CREATE TABLE user_emails (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            email TEXT UNIQUE NOT NULL,
+            timestamp TEXT NOT NULL,
+            download_count INTEGER DEFAULT 1
+        )
+    ''')
+    start = datetime(2025, 1, 1)
+    domains = ['gmail.com', 'yahoo.com', 'outlook.com', 'proton.me', 'example.org']
+    conn.executemany(
+        'INSERT INTO user_emails (email, timestamp, download_count) VALUES (?, ?, ?)',
+        (
+            (f'user{i}@{random.choice(domains)}',
+             (start + timedelta(seconds=i * 37, microseconds=random.randrange(1000000))).isoformat(),
+             random.randint(1, 5))
+            for i in range(rows)
+        )
+    )
+    conn.commit()
+    run_migrations(conn)
+    conn.close()
+
+
+def legacy_dataframe(path):
+    """The original Admin Panel code: fetchall, then a dict per row"""
+    import pandas as pd
+
+    conn = sqlite3.connect(path)
+    all_emails = conn.execute(
+        'SELECT id, email, timestamp, download_count FROM user_emails ORDER BY timestamp DESC'
+    ).fetchall()
+    conn.close()
+
+    email_data = []
+    for email_record in all_emails:
+        email_data.append({
+            'ID': email_record[0],
+            'Email': email_record[1],
+            'Timestamp': email_record[2],
+            'Download Count': email_record[3],
+            'Readable Date': pd.to_datetime(email_record[2]).strftime('%Y-%m-%d %H:%M:%S')
+        })
+    return pd.DataFrame(email_data)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--skip-legacy-above', type=int, default=None,
+                        help="don't run the slow legacy loop above this many rows")
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'legacy (s)':>12} {'vectorized (s)':>15} {'speedup':>9}")
+    for rows in args.rows:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'bench.db')
+            create_dataset(path, rows)
+            set_database_path(path)
+
+            new_time, new_df = timed(get_all_emails_dataframe)
+            if args.skip_legacy_above is not None and rows > args.skip_legacy_above:
+                print(f"{rows:>10} {'skipped':>12} {new_time:>15.3f} {'-':>9}")
+            else:
+                old_time, old_df = timed(legacy_dataframe, path)
+                assert len(old_df) == len(new_df)
+                print(f"{rows:>10} {old_time:>12.3f} {new_time:>15.3f} {old_time / new_time:>8.1f}x")
+            database.get_pool().close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+"""Bytes saved and apply time of delta.py on a synthetic multi-GB package
+
+Writes a v1 package of --size-mb to a temp directory (one big model file,
+a few library files and the app script), then a v2 with the edits a
+typical release makes: a few KB inserted into the middle of the model,
+1MB of it rewritten, the app script changed, one library added and one
+removed. Reports the delta size against the full download and against
+fixed 4MB blocks (which lose every block after the insertion), plus
+create and apply times.
+
+    python benchmarks/bench_delta.py --size-mb 2048
+    python benchmarks/bench_delta.py --size-mb 4096 --tmp /mnt/scratch
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import delta
+
+MB = 1024 * 1024
+FIXED_BLOCK = 4 * MB
+
+
+def write_random(path, size_mb):
+    with open(path, 'wb') as f:
+        for _ in range(size_mb):
+            f.write(os.urandom(MB))
+
+
+def make_versions(root, size_mb):
+    """v1 and v2 package directories under root"""
+    v1, v2 = os.path.join(root, 'DIV-AI-v1.0'), os.path.join(root, 'DIV-AI-v1.1')
+    for version in (v1, v2):
+        os.makedirs(os.path.join(version, 'lib'))
+
+    libs = max(size_mb // 16, 1)
+    write_random(os.path.join(v1, 'model.bin'), max(size_mb - 3 * libs, 1))
+    for name in ('core', 'audio', 'vision'):
+        write_random(os.path.join(v1, 'lib', f'{name}.pyd'), libs)
+    script = b''.join(b'def handler_%d(request):\n    return respond(request, %d)\n\n' % (i, i)
+                      for i in range(5000))
+    with open(os.path.join(v1, 'DIVAI.py'), 'wb') as f:
+        f.write(script)
+
+    # v2: same files with a release's worth of edits
+    with open(os.path.join(v1, 'model.bin'), 'rb') as src, open(os.path.join(v2, 'model.bin'), 'wb') as dst:
+        size = os.fstat(src.fileno()).st_size
+        copied = 0
+        while copied < size:
+            block = src.read(MB)
+            if copied == size // 2 // MB * MB:
+                dst.write(os.urandom(3000))   # insertion shifts everything after it
+            if copied == size * 3 // 4 // MB * MB:
+                block = os.urandom(len(block))   # 1MB rewritten in place
+            dst.write(block)
+            copied += len(block)
+    shutil.copyfile(os.path.join(v1, 'lib', 'core.pyd'), os.path.join(v2, 'lib', 'core.pyd'))
+    shutil.copyfile(os.path.join(v1, 'lib', 'audio.pyd'), os.path.join(v2, 'lib', 'audio.pyd'))
+    write_random(os.path.join(v2, 'lib', 'speech.pyd'), 1)
+    with open(os.path.join(v2, 'DIVAI.py'), 'wb') as f:
+        f.write(script.replace(b'return respond(request, 42)', b'return respond(request, 42, cached=True)'))
+    return v1, v2
+
+
+def fixed_block_bytes(v1, v2):
+    """Bytes a fixed-block diff would ship: every 4MB block that differs at the same offset"""
+    total = 0
+    for name in delta.package_files(v2):
+        old_path, new_path = os.path.join(v1, name), os.path.join(v2, name)
+        if not os.path.exists(old_path):
+            total += os.path.getsize(new_path)
+            continue
+        with open(old_path, 'rb') as old, open(new_path, 'rb') as new:
+            while True:
+                block = new.read(FIXED_BLOCK)
+                if not block:
+                    break
+                if old.read(FIXED_BLOCK) != block:
+                    total += len(block)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size-mb', type=int, default=2048, help='size of the v1 package')
+    parser.add_argument('--tmp', default=None, help='scratch directory (needs ~3x --size-mb free)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.tmp) as tmp:
+        start = time.perf_counter()
+        v1, v2 = make_versions(tmp, args.size_mb)
+        print(f"generated v1 + v2 ({args.size_mb:,} MB each) in {time.perf_counter() - start:.1f}s")
+
+        delta_path = os.path.join(tmp, 'v1.0-to-v1.1.divdelta')
+        start = time.perf_counter()
+        header = delta.create_delta(v1, v2, delta_path)
+        create_time = time.perf_counter() - start
+
+        out = os.path.join(tmp, 'patched')
+        start = time.perf_counter()
+        delta.apply_delta(v1, delta_path, out, verify_old=False)
+        apply_time = time.perf_counter() - start
+        start = time.perf_counter()
+        delta.apply_delta(v1, delta_path, os.path.join(tmp, 'patched-verified'))
+        verified_time = time.perf_counter() - start
+
+        for name in delta.package_files(v2):
+            assert delta.scan_sha256(os.path.join(out, name)) == delta.scan_sha256(os.path.join(v2, name)), name
+
+        total, delta_size, changed, same = delta.summarize(header, os.path.getsize(delta_path))
+        fixed = fixed_block_bytes(v1, v2)
+        print(f"{changed} files changed, {same} unchanged")
+        print(f"{'':<24} {'MB':>10} {'saved':>8}")
+        for label, size in (('full download', total), ('fixed 4MB blocks', fixed), ('content-defined delta', delta_size)):
+            print(f"{label:<24} {size / MB:>10,.2f} {100 - size * 100 / total:>7.2f}%")
+        print(f"create {create_time:.1f}s ({total / MB / create_time:,.0f} MB/s), "
+              f"apply {apply_time:.1f}s, apply + verify installed files {verified_time:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""Aggregate throughput of the self-hosted download server
+
+Writes a synthetic package of --size-mb to a temp directory, starts
+download_server.DownloadServer on a free local port and has --clients
+threads download it --downloads times each, half of them as two ranged
+requests (a resumed transfer). Runs once with sendfile and once with the
+mmap fallback and reports aggregate MB/s, per-download latency and how
+many requests were turned away by the --max-transfers cap.
+
+    python benchmarks/bench_download.py --clients 32 --size-mb 256
+    python benchmarks/bench_download.py --clients 64 --max-transfers 16
+"""
+import argparse
+import http.client
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_suite import percentiles
+from download_server import DownloadServer
+
+READ_SIZE = 1024 * 1024
+
+
+def fetch(host, port, path, headers=None):
+    """GET and discard the body - returns (status, bytes read)"""
+    conn = http.client.HTTPConnection(host, port, timeout=120)
+    try:
+        conn.request('GET', path, headers=headers or {})
+        response = conn.getresponse()
+        received = 0
+        while True:
+            chunk = response.read(READ_SIZE)
+            if not chunk:
+                break
+            received += len(chunk)
+        return response.status, received
+    finally:
+        conn.close()
+
+
+def download(host, port, path, size, resume):
+    """One complete download, split in two ranged requests if `resume`; retries 503s"""
+    parts = [{'Range': f'bytes=0-{size // 2 - 1}'}, {'Range': f'bytes={size // 2}-'}] if resume else [{}]
+    rejected = 0
+    received = 0
+    for headers in parts:
+        while True:
+            status, count = fetch(host, port, path, headers)
+            if status != 503:
+                break
+            rejected += 1
+            time.sleep(0.05)
+        assert status in (200, 206), status
+        received += count
+    assert received == size, (received, size)
+    return rejected
+
+
+def run(server, size, args):
+    host, port = server.server_address[:2]
+    path = '/' + server.file_name
+    latencies = []
+    rejected = [0]
+    lock = threading.Lock()
+
+    def client(n):
+        for i in range(args.downloads):
+            start = time.perf_counter()
+            turned_away = download(host, port, path, size, resume=(n + i) % 2 == 1)
+            with lock:
+                latencies.append(time.perf_counter() - start)
+                rejected[0] += turned_away
+
+    threads = [threading.Thread(target=client, args=(n,)) for n in range(args.clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return elapsed, sorted(latencies), rejected[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--clients', type=int, default=32)
+    parser.add_argument('--downloads', type=int, default=2, help='downloads per client')
+    parser.add_argument('--size-mb', type=int, default=128)
+    parser.add_argument('--max-transfers', type=int, default=64)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        package = os.path.join(tmp, 'DIV-AI-bench.zip')
+        with open(package, 'wb') as f:
+            block = os.urandom(READ_SIZE)
+            for _ in range(args.size_mb):
+                f.write(block)
+        size = os.path.getsize(package)
+        total_mb = size * args.clients * args.downloads / 1024 / 1024
+
+        print(f"{args.clients} clients x {args.downloads} downloads of {args.size_mb} MB "
+              f"({total_mb:,.0f} MB total), max {args.max_transfers} concurrent transfers")
+        print(f"{'mode':<10} {'MB/s':>10} {'p50 (s)':>9} {'p95 (s)':>9} {'503s':>7}")
+        for mode, zero_copy in (('sendfile', True), ('mmap', False)):
+            server = DownloadServer(('127.0.0.1', 0), package, args.max_transfers, zero_copy=zero_copy)
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            try:
+                elapsed, latencies, rejected = run(server, size, args)
+            finally:
+                server.shutdown()
+                server.server_close()
+            print(f"{mode:<10} {total_mb / elapsed:>10,.0f} {statistics.median(latencies):>9.2f} "
+                  f"{percentiles(latencies)['p95']:>9.2f} {rejected:>7}")
+
+
+if __name__ == '__main__':
+    main()
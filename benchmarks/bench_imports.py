@@ -0,0 +1,98 @@
+"""Import-time audit and cold-start benchmark
+
+Starts a fresh interpreter with `python -X importtime`, renders one page
+of div_ai.py through streamlit's AppTest and parses the import log. It
+reports total import time, the slowest top-level packages and whether
+any of the heavy optional libraries (pandas, pyarrow, numpy, psutil)
+were pulled in. Use --output to save the numbers as JSON and compare
+them across releases.
+
+    python benchmarks/bench_imports.py
+    python benchmarks/bench_imports.py --page Comparison --output imports.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ['pandas', 'pyarrow', 'numpy', 'psutil']
+
+RENDER_PAGE = '''
+import sys
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file(sys.argv[1], default_timeout=60).run()
+if sys.argv[2] != "Home":
+    at.sidebar.radio[0].set_value(sys.argv[2]).run()
+assert not at.exception, at.exception
+'''
+
+
+def parse_importtime(stderr):
+    """Return {module: (self_us, cumulative_us)} from -X importtime output"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def run_page(page):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    with tempfile.TemporaryDirectory() as tmp:
+        env['DIV_AI_DB_PATH'] = os.path.join(tmp, 'bench.db')
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', RENDER_PAGE, os.path.join(ROOT, 'div_ai.py'), page],
+            env=env, cwd=tmp, capture_output=True, text=True
+        )
+        wall = time.perf_counter() - start
+    if result.returncode != 0:
+        sys.exit(f"Rendering {page} failed:\n{result.stderr[-2000:]}")
+    return wall, parse_importtime(result.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--page', default='Home')
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--output', help='write results as JSON to this file')
+    args = parser.parse_args()
+
+    wall, modules = run_page(args.page)
+    total_ms = sum(self_us for self_us, _ in modules.values()) / 1000
+    top_level = {name: cumulative for name, (_, cumulative) in modules.items() if '.' not in name}
+    slowest = sorted(top_level.items(), key=lambda item: item[1], reverse=True)[:args.top]
+    # Match submodules too - a package's own line can be missing from the log
+    # when its import is triggered from another thread
+    heavy = [name for name in HEAVY_MODULES
+             if any(module == name or module.startswith(name + '.') for module in modules)]
+
+    print(f"Page: {args.page}")
+    print(f"Process wall time: {wall * 1000:.0f} ms")
+    print(f"Total import time: {total_ms:.0f} ms across {len(modules)} modules")
+    print(f"Heavy modules imported: {', '.join(heavy) or 'none'}")
+    print(f"\n{'package':<30} {'cumulative (ms)':>16}")
+    for name, cumulative in slowest:
+        print(f"{name:<30} {cumulative / 1000:>16.1f}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'page': args.page,
+                'wall_ms': round(wall * 1000, 1),
+                'import_ms': round(total_ms, 1),
+                'module_count': len(modules),
+                'heavy_modules': heavy,
+                'slowest': [{'module': name, 'cumulative_ms': round(c / 1000, 1)} for name, c in slowest],
+            }, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
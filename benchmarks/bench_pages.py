@@ -0,0 +1,69 @@
+"""Per-page rerun timing report
+
+Opens each page of the site in streamlit's AppTest and times a series of
+reruns on it, reporting the median and p95 rerun cost per page. Pass
+--script to time another copy of the app (e.g. an older checkout) for a
+before/after comparison.
+
+    python benchmarks/bench_pages.py --reruns 30
+    python benchmarks/bench_pages.py --script /tmp/old/div_ai.py
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from bench_suite import percentiles
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PAGES = [
+    "Home",
+    "Features",
+    "Comparison",
+    "Screenshots",
+    "Technical Specs",
+    "Download",
+    "FAQ",
+    "About Creator",
+    "Admin Panel",
+]
+
+
+def time_page(at, page, reruns):
+    at.sidebar.radio[0].set_value(page).run()
+    assert not at.exception, at.exception
+    timings = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        at.run()
+        timings.append((time.perf_counter() - start) * 1000)
+    return sorted(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--script', default=os.path.join(ROOT, 'div_ai.py'))
+    parser.add_argument('--reruns', type=int, default=30)
+    args = parser.parse_args()
+
+    script = os.path.abspath(args.script)
+    sys.path.insert(0, os.path.dirname(script))
+    from streamlit.testing.v1 import AppTest
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        os.environ['DIV_AI_DB_PATH'] = os.path.join(tmp, 'bench.db')
+        os.environ.setdefault('ADMIN_PASSWORD', 'bench')
+
+        at = AppTest.from_file(script, default_timeout=60).run()
+        print(f"{'page':<16} {'median (ms)':>12} {'p95 (ms)':>9}")
+        for page in PAGES:
+            timings = time_page(at, page, args.reruns)
+            print(f"{page:<16} {statistics.median(timings):>12.2f} {percentiles(timings)['p95']:>9.2f}")
+
+
+if __name__ == '__main__':
+    main()
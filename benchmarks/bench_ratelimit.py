@@ -0,0 +1,108 @@
+"""Load test for the email capture path under attack traffic
+
+Runs the same submission path as save_email (rate limiter check, then
+the download write) against a temporary database. A few "legitimate" clients
+submit at a human pace while attacker threads hammer the path as fast
+as they can. The test runs once without the limiter and once with it,
+and reports legitimate-client latency percentiles plus how much attack
+traffic reached SQLite.
+
+    python benchmarks/bench_ratelimit.py --attackers 8 --duration 10
+    python benchmarks/bench_ratelimit.py --rotate-keys   # botnet: new key per request
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import get_connection, get_pool, set_database_path
+from emails import upsert_email
+from migrations import run_migrations
+from ratelimit import RateLimiter
+
+
+def submit(limiter, key, email):
+    """Mirror of save_email without streamlit - returns True if written"""
+    if limiter is not None and not limiter.allow(key):
+        return False
+    upsert_email(email)
+    return True
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(int(len(values) * pct / 100), len(values) - 1)] if values else 0
+
+
+def run_scenario(limiter, args):
+    stop = threading.Event()
+    legit_latencies = []
+    attack_counts = {'admitted': 0, 'rejected': 0}
+    lock = threading.Lock()
+
+    def legit(n):
+        key = f'legit-{n}'
+        while not stop.is_set():
+            start = time.perf_counter()
+            submit(limiter, key, f'user{random.randrange(10**9)}@example.com')
+            with lock:
+                legit_latencies.append((time.perf_counter() - start) * 1000)
+            time.sleep(args.legit_interval)
+
+    def attacker(n):
+        admitted = rejected = 0
+        while not stop.is_set():
+            key = f'bot-{random.randrange(10**9)}' if args.rotate_keys else f'bot-{n}'
+            if submit(limiter, key, f'spam{random.randrange(10**9)}@bot.example'):
+                admitted += 1
+            else:
+                rejected += 1
+        with lock:
+            attack_counts['admitted'] += admitted
+            attack_counts['rejected'] += rejected
+
+    threads = [threading.Thread(target=legit, args=(n,)) for n in range(args.legit)]
+    threads += [threading.Thread(target=attacker, args=(n,)) for n in range(args.attackers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(args.duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return legit_latencies, attack_counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--legit', type=int, default=4, help='legitimate clients')
+    parser.add_argument('--legit-interval', type=float, default=0.5, help='seconds between legit submissions')
+    parser.add_argument('--attackers', type=int, default=8)
+    parser.add_argument('--rotate-keys', action='store_true', help='attackers use a new key every request')
+    parser.add_argument('--duration', type=float, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        set_database_path(os.path.join(tmp, 'bench.db'))
+        with get_connection() as conn:
+            run_migrations(conn)
+
+        # Legit clients submit every legit_interval seconds, so give them room
+        limiter = RateLimiter(rate_per_minute=max(120 / args.legit_interval, 6), burst=3,
+                              window_limit=10**6)
+
+        print(f"{'scenario':<14} {'legit p50':>10} {'legit p99':>10} {'legit max':>10} "
+              f"{'attack admitted':>16} {'attack rejected':>16}")
+        for label, scenario_limiter in (('no limiter', None), ('rate limited', limiter)):
+            latencies, attack = run_scenario(scenario_limiter, args)
+            print(f"{label:<14} {percentile(latencies, 50):>8.2f}ms {percentile(latencies, 99):>8.2f}ms "
+                  f"{max(latencies or [0]):>8.2f}ms {attack['admitted']:>16} {attack['rejected']:>16}")
+        get_pool().close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark per-rerun latency with and without the one-time bootstrap
+
+Runs div_ai.py through streamlit's AppTest and times a series of reruns
+of the Home page. "every rerun" clears st.cache_resource before each
+run, which reproduces the old behaviour of loading .env, reconnecting
+and checking the schema on every rerun. "cached" is the normal path
+where bootstrap() ran once for the process. The cost of bootstrap()
+itself is also reported, since AppTest adds its own per-run overhead.
+
+    python benchmarks/bench_startup.py --reruns 50
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_suite import percentiles
+
+
+def time_reruns(reruns, clear_cache):
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(os.path.join(ROOT, 'div_ai.py'), default_timeout=60)
+    at.run()
+    timings = []
+    for _ in range(reruns):
+        if clear_cache:
+            st.cache_resource.clear()
+        start = time.perf_counter()
+        at.run()
+        timings.append((time.perf_counter() - start) * 1000)
+        assert not at.exception, at.exception
+    return timings
+
+
+def time_bootstrap(runs):
+    """Time the per-process setup on its own, outside any rerun overhead"""
+    from bootstrap import bootstrap
+
+    bootstrap()
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        bootstrap()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--reruns', type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['DIV_AI_DB_PATH'] = os.path.join(tmp, 'bench.db')
+        print(f"{'mode':>12} {'mean (ms)':>10} {'median (ms)':>12} {'p95 (ms)':>9}")
+        for label, clear_cache in (('every rerun', True), ('cached', False)):
+            timings = time_reruns(args.reruns, clear_cache)
+            print(f"{label:>12} {statistics.mean(timings):>10.2f} {statistics.median(timings):>12.2f} "
+                  f"{percentiles(timings)['p95']:>9.2f}")
+
+        timings = time_bootstrap(args.reruns)
+        print(f"\nbootstrap() alone: {statistics.mean(timings):.2f} ms mean - saved on every cached rerun")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,317 @@
+"""Load test and regression benchmark for the whole site
+
+For each dataset size a synthetic user_emails table is generated (once,
+cached in --data-dir) in the original pre-migration schema, copied and
+brought up to date by the real migrations. A worker process per size
+then runs:
+
+- a direct database harness: latency of the admin read paths and of the
+  email write path under --writers concurrent threads, plus compaction
+- --sessions concurrent AppTest sessions, each in its own process,
+  navigating random pages (logging into the Admin Panel when it lands
+  there) and recording a download every so often, reporting rerun
+  latency percentiles per page
+
+Results, including the worker's peak RSS, are printed and written as
+JSON to --output so runs can be compared across commits.
+
+    python benchmarks/bench_suite.py --rows 1000 100000 --output bench.json
+    python benchmarks/bench_suite.py --rows 10000000 --sessions 4 --duration 60 --data-dir ~/bench-data
+"""
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import random
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+PAGES = ["Home", "Features", "Comparison", "Screenshots", "Technical Specs",
+         "Download", "FAQ", "About Creator", "Admin Panel"]
+
+ADMIN_PASSWORD = 'bench'
+
+
+def percentiles(values):
+    """Count, nearest-rank p50/p95/p99 and max - shared by the other benchmarks"""
+    values = sorted(values)
+    if not values:
+        return {'count': 0}
+
+    def pct(p):
+        return round(values[max(math.ceil(len(values) * p / 100) - 1, 0)], 3)
+    return {'count': len(values), 'p50': pct(50), 'p95': pct(95), 'p99': pct(99), 'max': round(values[-1], 3)}
+
+
+def create_dataset(path, rows):
+    """Synthetic signups over one year, in the version 1 schema"""
+    from migrations import create_user_emails
+
+    conn = sqlite3.connect(path)
+    create_user_emails(conn)
+    step = 365 * 86400 / max(rows, 1)
+    conn.execute('''
+        WITH RECURSIVE seq(i) AS (SELECT 0 UNION ALL SELECT i + 1 FROM seq WHERE i < ?1 - 1)
+        INSERT INTO user_emails (email, timestamp, download_count)
+        SELECT 'user' || i || '@' || CASE i % 7
+                   WHEN 0 THEN 'yahoo.com' WHEN 1 THEN 'outlook.com' WHEN 2 THEN 'proton.me'
+                   WHEN 3 THEN 'example.org' ELSE 'gmail.com' END,
+               strftime('%Y-%m-%dT%H:%M:%S', '2025-01-01', '+' || CAST(i * ?2 AS INTEGER) || ' seconds'),
+               1 + abs(random()) % 5
+        FROM seq
+    ''', (rows, step))
+    conn.commit()
+    conn.close()
+
+
+def get_dataset(data_dir, rows):
+    """Path of the cached raw dataset, generating it if needed"""
+    path = os.path.join(data_dir, f'user_emails_{rows}.db')
+    if os.path.exists(path):
+        return path, 0.0
+    start = time.perf_counter()
+    create_dataset(path + '.tmp', rows)
+    os.replace(path + '.tmp', path)
+    return path, time.perf_counter() - start
+
+
+def peak_rss_mb():
+    try:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    except ImportError:
+        import psutil
+        return psutil.Process().memory_info().peak_wset / 1024 / 1024
+
+
+def time_calls(func, repeats):
+    func()   # warm up lazy imports and the page cache
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return percentiles(timings)
+
+
+def db_harness(args):
+    """Admin read paths, then the write path under concurrent writers"""
+    from emails import (compact_download_events, get_activity_dataframe, get_domain_counts,
+                        get_email_page_dataframe, get_email_stats, upsert_email)
+    from lookup import get_lookup_cache, lookup_emails
+
+    year_ago = datetime.now().replace(year=datetime.now().year - 1).isoformat()
+    probe = [f'user{random.randrange(args.worker)}@gmail.com' for _ in range(500)]
+
+    def cold_lookup():
+        get_lookup_cache().clear()
+        lookup_emails(probe)
+
+    reads = {
+        'get_email_stats': get_email_stats,
+        'email_page': lambda: get_email_page_dataframe(50),
+        'email_page_search': lambda: get_email_page_dataframe(50, None, 'user12'),
+        'domain_counts': lambda: get_domain_counts(10),
+        'activity_daily_year': lambda: get_activity_dataframe('Day', year_ago),
+        'activity_hourly_year': lambda: get_activity_dataframe('Hour', year_ago),
+        'lookup_500_cold': cold_lookup,
+    }
+    results = {'reads_ms': {name: time_calls(func, args.repeats) for name, func in reads.items()}}
+
+    stop = threading.Event()
+    latencies = []
+    lock = threading.Lock()
+
+    def writer():
+        mine = []
+        while not stop.is_set():
+            start = time.perf_counter()
+            upsert_email(f'bench-{uuid.uuid4().hex[:12]}@example.com')
+            mine.append((time.perf_counter() - start) * 1000)
+        with lock:
+            latencies.extend(mine)
+
+    threads = [threading.Thread(target=writer) for _ in range(args.writers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(args.write_seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    results['writes'] = dict(percentiles(latencies), per_second=round(len(latencies) / args.write_seconds, 1))
+
+    start = time.perf_counter()
+    folded = compact_download_events()
+    results['compaction'] = {'events': folded, 'ms': round((time.perf_counter() - start) * 1000, 3)}
+    return results
+
+
+def session(args):
+    """One simulated visitor clicking around the site, in its own process
+
+    AppTest isn't safe to drive from several threads, so each session is a
+    process. Returns ({page: [ms]}, error or None, peak RSS in MB).
+    """
+    from streamlit.testing.v1 import AppTest
+    from emails import upsert_email
+
+    timings = {}
+    try:
+        at = AppTest.from_file(os.path.join(ROOT, 'div_ai.py'), default_timeout=args.timeout).run()
+        # Visit every page once untimed, so cold imports don't skew the percentiles
+        for page in PAGES:
+            at.sidebar.radio[0].set_value(page).run()
+        deadline = time.monotonic() + args.duration
+        while time.monotonic() < deadline:
+            page = random.choice(PAGES)
+            start = time.perf_counter()
+            at.sidebar.radio[0].set_value(page).run()
+            timings.setdefault(page, []).append((time.perf_counter() - start) * 1000)
+            if at.exception:
+                raise RuntimeError(f"{page}: {at.exception}")
+            if page == "Admin Panel":
+                start = time.perf_counter()
+                at.text_input[0].set_value(ADMIN_PASSWORD).run()
+                timings.setdefault("Admin Dashboard", []).append((time.perf_counter() - start) * 1000)
+                if at.exception:
+                    raise RuntimeError(f"Admin Dashboard: {at.exception}")
+            if random.random() < args.submit_rate:
+                upsert_email(f'visitor-{uuid.uuid4().hex[:12]}@example.com')
+    except Exception as e:
+        return timings, f"{type(e).__name__}: {e}", peak_rss_mb()
+    return timings, None, peak_rss_mb()
+
+
+def run_sessions(args):
+    page_timings, errors, rss = {}, [], []
+    with multiprocessing.get_context('spawn').Pool(args.sessions) as pool:
+        for timings, error, peak in pool.map(session, [args] * args.sessions):
+            for page, values in timings.items():
+                page_timings.setdefault(page, []).extend(values)
+            if error:
+                errors.append(error)
+            rss.append(peak)
+    reruns = sum(len(timings) for timings in page_timings.values())
+    return {
+        'pages_ms': {page: percentiles(timings) for page, timings in sorted(page_timings.items())},
+        'reruns_per_second': round(reruns / args.duration, 2),
+        'session_peak_rss_mb': round(max(rss), 1),
+        'errors': errors,
+    }
+
+
+def worker(args):
+    """Benchmark one dataset in this (fresh) process and print JSON"""
+    tmp = tempfile.mkdtemp()
+    try:
+        db_path = os.path.join(tmp, 'bench.db')
+        shutil.copyfile(args.dataset, db_path)
+        os.chdir(tmp)
+        os.environ.update(DIV_AI_DB_PATH=db_path, ADMIN_PASSWORD=ADMIN_PASSWORD)
+
+        from bootstrap import bootstrap
+        start = time.perf_counter()
+        bootstrap()
+        result = {'rows': args.worker, 'migrate_s': round(time.perf_counter() - start, 3)}
+        result.update(db_harness(args))
+        if args.sessions:
+            result['sessions'] = run_sessions(args)
+        result['db_mb'] = round(os.path.getsize(db_path) / 1024 / 1024, 1)
+        result['peak_rss_mb'] = round(peak_rss_mb(), 1)
+        print(json.dumps(result))
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                              capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def print_report(result):
+    print(f"\n== {result['rows']:,} rows  (generate {result['generate_s']:.1f}s, migrate {result['migrate_s']:.1f}s, "
+          f"db {result['db_mb']} MB, peak RSS {result['peak_rss_mb']} MB)")
+    print(f"{'read path':<24} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}")
+    for name, stats in result['reads_ms'].items():
+        print(f"{name:<24} {stats['p50']:>9.2f} {stats['p95']:>9.2f} {stats['max']:>9.2f}")
+    writes = result['writes']
+    print(f"writes: {writes['per_second']:,.0f}/s  p50 {writes.get('p50', 0):.2f}ms  p99 {writes.get('p99', 0):.2f}ms  "
+          f"compaction of {result['compaction']['events']:,} events {result['compaction']['ms']:.1f}ms")
+    if 'sessions' in result:
+        sessions = result['sessions']
+        print(f"{'page':<18} {'reruns':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+        for page, stats in sessions['pages_ms'].items():
+            print(f"{page:<18} {stats['count']:>7} {stats['p50']:>9.1f} {stats['p95']:>9.1f} {stats['p99']:>9.1f}")
+        print(f"{sessions['reruns_per_second']} reruns/s across all sessions, "
+              f"peak session RSS {sessions['session_peak_rss_mb']} MB")
+        for error in sessions['errors']:
+            print(f"session error: {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 100000, 1000000])
+    parser.add_argument('--sessions', type=int, default=4, help='concurrent AppTest sessions, 0 to skip')
+    parser.add_argument('--duration', type=float, default=20, help='seconds of session traffic')
+    parser.add_argument('--submit-rate', type=float, default=0.2, help='chance a page view records a download')
+    parser.add_argument('--writers', type=int, default=4)
+    parser.add_argument('--write-seconds', type=float, default=5)
+    parser.add_argument('--repeats', type=int, default=20, help='calls per read path')
+    parser.add_argument('--timeout', type=float, default=120, help='AppTest timeout per rerun')
+    parser.add_argument('--data-dir', default=os.path.join(tempfile.gettempdir(), 'div_ai_bench_data'),
+                        help='where generated datasets are cached')
+    parser.add_argument('--output', help='write results as JSON to this file')
+    parser.add_argument('--worker', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--dataset', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        return worker(args)
+
+    os.makedirs(args.data_dir, exist_ok=True)
+    report = {
+        'commit': git_commit(),
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'sqlite': sqlite3.sqlite_version,
+        'settings': {key: value for key, value in vars(args).items()
+                     if key not in ('worker', 'dataset', 'output', 'data_dir')},
+        'datasets': [],
+    }
+    passthrough = [f'--sessions={args.sessions}', f'--duration={args.duration}',
+                   f'--submit-rate={args.submit_rate}', f'--writers={args.writers}',
+                   f'--write-seconds={args.write_seconds}', f'--repeats={args.repeats}',
+                   f'--timeout={args.timeout}']
+    for rows in args.rows:
+        dataset, generate_s = get_dataset(args.data_dir, rows)
+        # A fresh process per size, so peak RSS and caches belong to this dataset only
+        proc = subprocess.run([sys.executable, os.path.abspath(__file__), f'--worker={rows}',
+                               f'--dataset={dataset}'] + passthrough, capture_output=True, text=True)
+        if proc.returncode != 0:
+            sys.exit(f"Benchmark of {rows} rows failed:\n{proc.stderr[-3000:]}")
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        result['generate_s'] = round(generate_s, 3)
+        report['datasets'].append(result)
+        print_report(result)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
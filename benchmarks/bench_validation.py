@@ -0,0 +1,71 @@
+"""Benchmark email validation on a synthetic corpus
+
+Compares the original validate_email (re.match with the pattern string
+on every call) with the precompiled, cached validate_email and the
+validate_emails batch API. The corpus mixes valid and invalid addresses
+with repeats, like a real signup list.
+
+    python benchmarks/bench_validation.py --count 1000000
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from validation import validate_email, validate_emails
+
+
+def legacy_validate_email(email):
+    """Original implementation from div_ai.py"""
+    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+    return re.match(pattern, email) is not None
+
+
+def make_corpus(count, unique_ratio=0.8, seed=42):
+    rng = random.Random(seed)
+    domains = ['gmail.com', 'yahoo.co.uk', 'outlook.com', 'proton.me', 'example.org']
+    broken = ['user@@x.com', 'no-at-sign.com', 'a@b', 'trailing@dot.', 'sp ace@x.com', '@x.com']
+    unique = []
+    for i in range(int(count * unique_ratio)):
+        if rng.random() < 0.05:
+            unique.append(rng.choice(broken).replace('x', str(i)))
+        else:
+            unique.append(f'user{i}.{rng.randrange(1000)}@{rng.choice(domains)}')
+    return [rng.choice(unique) if i >= len(unique) else unique[i] for i in range(count)]
+
+
+def timed(label, func, baseline=None):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    speedup = f"{baseline / elapsed:>8.1f}x" if baseline else f"{'-':>9}"
+    print(f"{label:<28} {elapsed:>9.3f}s {speedup}")
+    return elapsed, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=1000000)
+    parser.add_argument('--unique-ratio', type=float, default=0.8,
+                        help='fraction of distinct addresses; lower means more repeats')
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.count, args.unique_ratio)
+    print(f"{len(corpus)} addresses\n")
+    print(f"{'implementation':<28} {'time':>10} {'speedup':>9}")
+
+    base, expected = timed('legacy re.match per call', lambda: [legacy_validate_email(e) for e in corpus])
+    validate_email.cache_clear()
+    _, cached = timed('precompiled + LRU', lambda: [validate_email(e) for e in corpus], base)
+    _, batch = timed('validate_emails batch', lambda: [ok for _, ok in validate_emails(corpus)], base)
+
+    assert cached == expected and batch == expected, "results differ from the legacy validator"
+    print(f"\nLRU: {validate_email.cache_info()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""One-time process setup for the DIV-AI site
+
+Everything here used to run at the top of div_ai.py on every Streamlit
+rerun. get_config() in views/common.py now calls bootstrap() through
+st.cache_resource, so it runs once per server process.
+"""
+import os
+import tempfile
+
+from database import get_connection, set_database_path
+from emails import set_write_behind_interval, start_event_compactor
+from lookup import configure_lookup_cache
+from migrations import run_migrations
+from profiling import configure_profiling, timer
+
+
+def load_config():
+    """Load .env (if python-dotenv is installed) and parse settings"""
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
+
+    return {
+        'db_path': os.getenv('DIV_AI_DB_PATH', 'div_ai_emails.db'),
+        'admin_password': os.getenv('ADMIN_PASSWORD', 'fallback_password'),
+        'write_behind_ms': int(os.getenv('DIV_AI_WRITE_BEHIND_MS', '0')),
+        'compact_seconds': int(os.getenv('DIV_AI_COMPACT_SECONDS', '60')),
+        'email_rate_per_minute': float(os.getenv('DIV_AI_EMAIL_RATE_PER_MINUTE', '6')),
+        'email_burst': int(os.getenv('DIV_AI_EMAIL_BURST', '3')),
+        'email_hourly_limit': int(os.getenv('DIV_AI_EMAIL_HOURLY_LIMIT', '30')),
+        'email_global_rate': float(os.getenv('DIV_AI_EMAIL_GLOBAL_RATE', '50')),
+        # Reverse proxies in front of the app; 0 rate-limits per session, not per IP
+        'trusted_proxies': int(os.getenv('DIV_AI_TRUSTED_PROXIES', '0')),
+        'download_url': os.getenv('DIV_AI_DOWNLOAD_URL', ''),
+        'manifest_path': os.getenv('DIV_AI_MANIFEST_PATH', ''),
+        'delta_path': os.getenv('DIV_AI_DELTA_PATH', ''),
+        'delta_url': os.getenv('DIV_AI_DELTA_URL', ''),
+        'lookup_cache_size': int(os.getenv('DIV_AI_LOOKUP_CACHE_SIZE', '10000')),
+        'lookup_ttl': float(os.getenv('DIV_AI_LOOKUP_TTL', '300')),
+        'monitor_interval': float(os.getenv('DIV_AI_MONITOR_INTERVAL', '5')),
+        'monitor_samples': int(os.getenv('DIV_AI_MONITOR_SAMPLES', '720')),
+        'job_workers': int(os.getenv('DIV_AI_JOB_WORKERS', '2')),
+        'job_dir': os.getenv('DIV_AI_JOB_DIR', os.path.join(tempfile.gettempdir(), 'div_ai_jobs')),
+        'job_max_age': float(os.getenv('DIV_AI_JOB_MAX_AGE', str(24 * 3600))),
+        'profiling': os.getenv('DIV_AI_PROFILING', '1') != '0',
+        'metrics_file': os.getenv('DIV_AI_METRICS_FILE', ''),
+    }
+
+
+def init_database():
+    """Initialize SQLite database for email storage"""
+    # Schema changes live in migrations.py; this is a no-op once the
+    # database is at the latest version
+    with timer('init_database'), get_connection() as conn:
+        run_migrations(conn)
+
+
+def bootstrap():
+    """Load config, point the pool at the database and migrate it"""
+    config = load_config()
+    configure_profiling(config['profiling'], config['metrics_file'])
+    set_database_path(config['db_path'])
+    set_write_behind_interval(config['write_behind_ms'])
+    configure_lookup_cache(config['lookup_cache_size'], config['lookup_ttl'])
+    init_database()
+    start_event_compactor(config['compact_seconds'])
+    return config
@@ -0,0 +1,531 @@
+"""Static content for the marketing pages
+
+Page text lives here as plain data. build_page_content() turns it into
+the markdown/HTML blocks and tables each page shows; get_page_content()
+in views/common.py caches the result with st.cache_data keyed on
+CONTENT_VERSION, so bump the version whenever anything in this file
+changes.
+"""
+
+from lazy_imports import lazy_import
+
+pd = lazy_import('pandas')
+
+CONTENT_VERSION = 7
+
+# Default package location when no self-hosted DIV_AI_DOWNLOAD_URL is set
+GOOGLE_DRIVE_URL = "https://drive.google.com/file/d/1hGyhFBbwJBXQbUBTD8l-dWjQYqThsXvG/view?usp=sharing"
+
+
+def feature_cards(items):
+    """Render (title, paragraph, ...) tuples as one block of feature cards"""
+    cards = []
+    for title, *paragraphs in items:
+        body = "".join(f"\n    <p>{paragraph}</p>" for paragraph in paragraphs)
+        cards.append(f'<div class="feature-card">\n    <h4>{title}</h4>{body}\n</div>\n')
+    return "\n".join(cards)
+
+
+def stat_boxes(items):
+    """Render (value, label) pairs as stat boxes"""
+    return "\n".join(
+        f'<div class="stat-box">\n    <h3>{value}</h3>\n    <p>{label}</p>\n</div>\n'
+        for value, label in items
+    )
+
+
+HOME = {
+    'title': "## Complete Privacy. Unlimited Power.",
+    'note': "NOTE : frontend is generated by ai bcoz i was too lazy to write whole code just to give you a download button. if you want to see my front end capabilities you can go on my github and check repository ",
+    'intro': """
+        **DIV-AI** is revolutionary offline AI assistant that runs entirely on your local machine.
+        No internet connection required, no data leaves your computer, no subscriptions needed.
+
+        ### Why Choose DIV-AI?
+        """,
+    'cards': [
+        ("100% Private & Secure", "All processing happens locally. Your conversations never leave your computer."),
+        ("Lightning Fast Responses", "Instant answers to personal questions, optimized AI responses for complex queries."),
+        ("No Subscriptions Ever", "One-time download, lifetime usage. No monthly fees, no usage limits."),
+        ("Works Offline Always", "Perfect for secure environments, remote areas, or when you want guaranteed uptime."),
+    ],
+    'stats': [
+        ("2.7B", "Parameters"),
+        ("1.65GB", "Download Size"),
+        ("4GB RAM", "Minimum Required"),
+        ("0%", "Data Collection"),
+    ],
+    'perfect_for': """
+        - **Privacy-conscious users**
+        - **Businesses with sensitive data**
+        - **Students and researchers**
+        - **Remote workers**
+        - **Anyone wanting AI without internet**
+        """,
+}
+
+FEATURES = {
+    'capabilities': """
+        ### Smart AI Capabilities
+        - **Programming Assistance**: Code help, debugging, explanations
+        - **Creative Writing**: Stories, essays, content creation
+        - **Problem Solving**: Complex analysis and solutions
+        - **Educational Support**: Learning assistance, explanations
+        - **General Knowledge**: Wide range of topics covered
+        """,
+    'interface': """
+        ### User Interface
+        - **Clean, Modern GUI**: Intuitive Tkinter-based interface
+        - **Quick Question Buttons**: Instant access to common queries
+        - **Real-time Monitoring**: CPU and RAM usage display
+        - **Conversation Management**: Clear, organized chat interface
+        - **Keyboard Shortcuts**: Efficient workflow support
+        """,
+    'technical': """
+        ### Technical Excellence
+        - **Optimized Performance**: CPU and memory efficient
+        - **Process Management**: Safe operation with timeout protection
+        - **Resource Control**: Configurable thread and batch limits
+        - **Portable Design**: Works from any folder location
+        - **Error Handling**: Robust error recovery and reporting
+        """,
+    'customization': """
+        ### Customization Options
+        - **Response Length Control**: Adjustable output limits
+        - **Performance Tuning**: CPU thread and memory settings
+        - **Interface Themes**: Clean, professional appearance
+        - **File Management**: Automatic path detection
+        - **System Integration**: Native Windows experience
+        """,
+    'cards': [
+        ("Hardcoded Instant Responses", "Personal questions about DIV-AI get instant answers - no AI processing delay"),
+        ("Memory Optimization", "Smart resource usage prevents system slowdown while maintaining quality"),
+        ("Self-Contained Package", "Everything included - no complex setup or external dependencies"),
+        ("Professional Quality", "Enterprise-grade AI model optimized for consumer hardware"),
+        ("Future-Proof Design", "Modular architecture allows for easy updates and enhancements"),
+    ],
+}
+
+COMPARISON = {
+    'table': {
+        "Feature": [
+            "Privacy (Data stays local)",
+            "Works Offline",
+            "No Subscription Fees",
+            "No Usage Limits",
+            "Instant Availability",
+            "No Account Required",
+            "Corporate/Business Safe",
+            "Open Source Interface",
+            "One-time Purchase",
+            "No Internet Dependency"
+        ],
+        "DIV-AI": ["✅", "✅", "✅", "✅", "✅", "✅", "✅", "✅", "✅", "✅"],
+        "ChatGPT": ["❌", "❌", "❌", "❌", "⚠️", "❌", "⚠️", "❌", "❌", "❌"],
+        "Claude": ["❌", "❌", "❌", "❌", "⚠️", "❌", "⚠️", "❌", "❌", "❌"],
+        "Bard/Gemini": ["❌", "❌", "✅", "⚠️", "⚠️", "❌", "⚠️", "❌", "✅", "❌"],
+        "Local LLMs": ["✅", "✅", "✅", "✅", "⚠️", "✅", "✅", "⚠️", "✅", "✅"]
+    },
+    'privacy': """
+        **Unmatched Privacy**
+        - Zero data collection
+        - No cloud processing
+        - Complete local control
+        - GDPR/CCPA compliant by design
+        """,
+    'cost': """
+        **True Cost Efficiency**
+        - No monthly subscriptions
+        - No usage-based billing
+        - One download, lifetime use
+        - Perfect for budget-conscious users
+        """,
+    'performance': """
+        **Reliable Performance**
+        - Always available offline
+        - No server downtime issues
+        - Consistent response times
+        - Not affected by internet speed
+        """,
+    'business': """
+        **Business Ready**
+        - Safe for sensitive data
+        - No external data sharing
+        - Compliance-friendly
+        - Internal use approved
+        """,
+}
+
+SCREENSHOTS = {
+    'main_interface': """
+        ```
+        ┌─────────────────────────────────────┐
+        │              DIV-AI                 │
+        │   Your Personal Offline AI          │
+        │                                     │
+        │ CPU: 15.2% | RAM: 45.1% | Div_v1   │
+        ├─────────────────────────────────────┤
+        │ [Who are you?] [What model?] [...]  │
+        ├─────────────────────────────────────┤
+        │ Your Question:                      │
+        │ ┌─────────────────────────────────┐ │
+        │ │ How does photosynthesis work?   │ │
+        │ └─────────────────────────────────┘ │
+        │                                     │
+        │ [Ask DIVAI] [Stop] [Clear] [Files]  │
+        ├─────────────────────────────────────┤
+        │ DIV-AI Response:                    │
+        │ ┌─────────────────────────────────┐ │
+        │ │ Photosynthesis is the process   │ │
+        │ │ by which plants convert light   │ │
+        │ │ energy into chemical energy...  │ │
+        │ └─────────────────────────────────┘ │
+        └─────────────────────────────────────┘
+        ```
+        """,
+    'quick_questions': """
+        **Instant Responses for:**
+        - "Who are you?" → Immediate DIV-AI info
+        - "What model?" → Technical specifications
+        - "Your capabilities" → Feature overview
+        - "Privacy info" → Security details
+
+        **No waiting time for personal questions!**
+        """,
+    'cards': [
+        ("Resource Monitor", "Real-time CPU and RAM usage displayed in header"),
+        ("Quick Access Buttons", "One-click access to common questions about DIV-AI"),
+        ("Smart Input Box", "Supports multi-line questions with scroll capability"),
+        ("Clean Output", "Filtered responses without technical debug information"),
+        ("Control Buttons", "Ask, Stop, Clear functions with intuitive icons"),
+        ("File Verification", "Check Files button ensures proper installation"),
+        ("Status Feedback", "Clear indication of processing state and completion"),
+    ],
+}
+
+TECHNICAL_SPECS = {
+    'requirements': """
+        **Minimum Requirements:**
+        - **OS**: Windows 10/11 (64-bit)
+        - **RAM**: 4GB available memory
+        - **CPU**: Multi-core processor (2+ cores)
+        - **Storage**: 2GB free disk space
+        - **Architecture**: x64 compatible
+
+        **Recommended Specifications:**
+        - **RAM**: 8GB+ for optimal performance
+        - **CPU**: Modern quad-core processor
+        - **Storage**: SSD for faster model loading
+        - **Cooling**: Adequate CPU cooling for sustained use
+        """,
+    'included': """
+        **Core Components:**
+        - `DIVAI.py` - Main application interface
+        - `div-cli.exe` - AI inference engine
+        - `div_quant.gguf` - Div_v1_Quant model (1.5GB)
+        - Essential DLL files for Windows compatibility
+
+        **Additional Files:**
+        - `README.md` - Complete documentation
+        - `requirements.txt` - Python dependencies
+        - Installation and usage guides
+        """,
+    'model': """
+        **Div_v1_Quant Specifications:**
+        - **Parameters**: 2.7 billion
+        - **Quantization**: 4-bit (Q4_K_M format)
+        - **Context Window**: 2048 tokens (512 optimized)
+        - **Model Size**: ~1.5GB compressed
+        - **Training**: Optimized for general assistance
+
+        **Performance Optimizations:**
+        - **CPU Threads**: Limited to 2 for stability
+        - **Batch Size**: 32 tokens for efficiency
+        - **Response Limit**: 200 tokens for speed
+        - **Memory Usage**: ~2-3GB RAM during operation
+        - **Process Priority**: Below normal to prevent lag
+        """,
+    'performance': """
+        **Response Times:**
+        - Personal questions: Instant (0.1s)
+        - Simple queries: 10-30 seconds
+        - Complex analysis: 30-90 seconds
+        - Code generation: 20-60 seconds
+
+        **Resource Usage:**
+        - CPU: 20-40% during processing
+        - RAM: 2-4GB peak usage
+        - Disk I/O: Minimal after model load
+        """,
+    'cards': [
+        ("Frontend", "Python Tkinter GUI with real-time monitoring and responsive design"),
+        ("Backend", "Custom compiled inference engine based on llama.cpp architecture"),
+        ("Model Format", "GGUF format with 4-bit quantization for optimal size/quality balance"),
+        ("Process Management", "Subprocess handling with timeout protection and priority control"),
+        ("Memory Optimization", "Smart context management and batch processing for efficiency"),
+        ("Error Handling", "Comprehensive exception handling with user-friendly error messages"),
+    ],
+}
+
+DOWNLOAD = {
+    'banner': """
+    <div style="text-align: center; padding: 2rem; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; border-radius: 10px; margin: 2rem 0;">
+        <h2>Ready to Experience True AI Privacy?</h2>
+        <p style="font-size: 1.2em;">Download DIV-AI now and start using AI without compromising your privacy!</p>
+    </div>
+    """,
+    'package_card': """
+        <div class="feature-card" style="text-align: center;">
+            <h4>DIV-AI Complete Package</h4>
+            <p><strong>Size:</strong> 1.65GB</p>
+            <p><strong>Includes:</strong> Full application + AI model + All dependencies</p>
+            <br>
+            <a href="{download_url}"
+               target="_blank"
+               style="background: linear-gradient(45deg, #667eea, #764ba2); color: white; padding: 1rem 2rem;
+                      border-radius: 25px; text-decoration: none; font-weight: bold; font-size: 1.1em;
+                      display: inline-block; margin: 1rem 0; transition: transform 0.3s;">
+                {download_label}
+            </a>
+        </div>
+        """,
+    'installation': """
+        1. **Click the download link** above to access Google Drive
+        2. **Download the ZIP file** to your computer
+        3. **Extract** the downloaded ZIP file to your desired location
+        4. **Run** `DIVAI.exe` from the extracted folder
+        5. **Click "Check Files"** to verify installation
+        6. **Start chatting** with your private AI!
+    """,
+    'installation_direct': """
+        1. **Click the download link** above to start the download
+        2. **Save the ZIP file** to your computer
+        3. **Extract** the downloaded ZIP file to your desired location
+        4. **Run** `DIVAI.exe` from the extracted folder
+        5. **Click "Check Files"** to verify installation
+        6. **Start chatting** with your private AI!
+    """,
+    'instructions_direct': """
+        **Direct download:**
+        1. Click the download link above
+        2. The file will download to your Downloads folder - if it is interrupted, start it again and your browser or download manager will resume where it stopped
+        3. Extract and run as instructed above
+
+        **File Details:**
+        - **Filename**: DIV-AI-v1.0.zip
+        - **Size**: 1.65GB
+        - **Contents**: Complete DIV-AI application with AI model
+    """,
+    'instructions': """
+        **From Google Drive:**
+        1. Click the download link above
+        2. On Google Drive, click the **Download** button (arrow pointing down)
+        3. The file will download to your Downloads folder
+        4. Extract and run as instructed above
+
+        **File Details:**
+        - **Filename**: DIV-AI-v1.0.zip
+        - **Size**: 1.65GB
+        - **Contents**: Complete DIV-AI application with AI model
+    """,
+    'cards': [
+        ("Complete AI Assistant", "<strong>Full offline AI capabilities</strong>",
+         "Professional quality responses without internet dependency"),
+        ("Privacy Guaranteed", "<strong>Zero data collection</strong>",
+         "All processing happens locally on your machine"),
+        ("Lifetime Value", "<strong>No subscription fees</strong>",
+         "No usage limits, free updates included"),
+    ],
+    'benefits': """
+        **Complete AI Assistant**
+        - Full offline AI capabilities
+        - No internet dependency
+        - Professional quality responses
+
+        **Privacy Guaranteed**
+        - Zero data collection
+        - No cloud processing
+        - Complete local control
+
+        **Lifetime Value**
+        - No subscription fees
+        - No usage limits
+        - Free updates included
+
+        **Professional Support**
+        - Complete documentation
+        - GitHub issue support
+        - Active community
+        """,
+    'verify': """
+        The package is published with a checksum manifest: a SHA-256 for every 4MB chunk and a
+        Merkle root for the whole file. If the download is interrupted or the ZIP won't extract,
+        check it against the manifest with `python manifest.py --verify <manifest> <zip>` -
+        it lists exactly which byte ranges are damaged, so only those need downloading again
+        (e.g. `curl -r <start>-<end>`) instead of the full 1.65GB.
+        """,
+    'update': """
+        Already running **{from_version}**? Download just the changes instead of the full package,
+        then patch your install into **{to_version}**:
+        1. Download the update file ({delta_mb:,.1f}MB instead of {full_mb:,.0f}MB)
+        2. Download `delta.py` with the button below - the patcher isn't part of the DIV-AI package,
+           and it only needs [Python 3.7+](https://www.python.org/downloads/), no other packages
+        3. Run `python delta.py apply <DIV-AI folder> <update file> <new folder>`
+        4. Start `DIVAI.exe` from the new folder - every file is checked against its SHA-256 while patching,
+           and the update refuses to apply to a modified or different version
+        """,
+    'secure': """
+        **Your Privacy:**
+        - Email stored in plain text
+        - No spam or marketing emails
+        - Used only for download verification
+        - Can be deleted anytime
+        """,
+    'notes': """
+    **System Compatibility**: Currently Windows 10/11 (64-bit) only. Linux/macOS versions coming soon!
+
+    **First Run**: Initial model loading may take 30-60 seconds. Subsequent starts are much faster.
+
+    **Antivirus**: Some antivirus software may flag the executable as unknown. This is normal for new software.
+    """,
+}
+
+FAQ = {
+    'faqs': {
+        "Privacy & Security": [
+            ("Is my data really private?", "Absolutely! DIV-AI runs completely offline. Your conversations never leave your computer, and we don't collect any data whatsoever."),
+            ("Can you see my conversations?", "No, we cannot. There's no telemetry, no data transmission, and no tracking. Your privacy is 100% guaranteed."),
+            ("Is it safe for business use?", "Yes! DIV-AI is perfect for businesses with sensitive data since everything stays local and private."),
+            ("Does it connect to the internet?", "No internet connection is required or used. DIV-AI works completely offline.")
+        ],
+
+        "Performance & Usage": [
+            ("Why is it slow compared to ChatGPT?", "DIV-AI runs on your local hardware, not powerful cloud servers. The trade-off is complete privacy and no internet dependency."),
+            ("How can I make it faster?", "Close other applications, ensure good CPU cooling, ask shorter questions, and consider upgrading your hardware."),
+            ("Does it work on older computers?", "Yes, but performance depends on your CPU. 4GB RAM and a multi-core processor are minimum requirements."),
+            ("Can I run multiple instances?", "It's not recommended as it would consume significant system resources.")
+        ],
+
+        "Pricing & Licensing": [
+            ("Is it really free?", "Yes! DIV-AI is completely free to download and use. No subscriptions, no hidden fees, no usage limits."),
+            ("Will there be paid versions?", "The core DIV-AI will always remain free. We may offer premium models or features in the future."),
+            ("Can I use it commercially?", "Yes, DIV-AI can be used for commercial purposes without additional licensing fees."),
+            ("Are there any usage restrictions?", "No usage limits whatsoever. Use it as much as you want, whenever you want.")
+        ],
+
+        "Technical Support": [
+            ("What if I encounter bugs?", "Report issues on our GitHub page. We actively monitor and fix bugs reported by users."),
+            ("Can I modify the code?", "Yes! The interface code is open source. The AI model and inference engine are proprietary."),
+            ("Will you add new features?", "Yes, we regularly update DIV-AI with new features based on user feedback."),
+            ("How do I update DIV-AI?", "Updates are released as new versions. When the Download page lists an update from your version, download just that small update file and apply it with delta.py into a new folder. Otherwise download the full package and replace the old files.")
+        ],
+
+        "Installation & Setup": [
+            ("Why is the download so large?", "The AI model file is ~1.5GB. This is necessary for high-quality offline AI capabilities."),
+            ("Do I need Python installed?", "No, the complete package includes everything needed. Python is only required if running from source code or applying an update with delta.py."),
+            ("Can I move it to another computer?", "Yes! Simply copy the entire DIV-AI folder to any Windows computer."),
+            ("What if files are missing?", "Use the 'Check Files' button in DIV-AI to verify all required files are present.")
+        ]
+    },
+    'contact': """
+    **Can't find what you're looking for?**
+
+    - **Email Support**: [divyanshpandiit@gmail.com]
+    - **GitHub Issues**: [Create an issue](https://github.com/divyanshpandit/div-ai/issues)
+    - **Documentation**: Check our comprehensive README
+    - **Community**: Join discussions on GitHub
+
+    We typically respond within 24-48 hours!
+    """,
+}
+
+ABOUT_CREATOR = {
+    'photo_placeholder': """
+            <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+                        height: 300px; border-radius: 15px; display: flex;
+                        align-items: center; justify-content: center; color: white; font-size: 3em;">
+                👨‍💻
+            </div>
+            """,
+    'bio': """
+        Divyansh is a passionate AI developer and privacy advocate who believes that
+        powerful AI should be accessible to everyone without compromising personal privacy.
+
+        **Mission**: To democratize AI technology while keeping user privacy intact.
+
+        **Vision**: A world where everyone can benefit from AI without giving up their data.
+        """,
+    'achievements': """
+        - **Created DIV-AI**: The first truly private offline AI assistant
+        - **Optimized Div_v1_Quant**: Custom AI model for consumer hardware
+        - **Built Privacy-First Tools**: Focus on user data protection
+        - **Active Open Source Contributor**: Believes in community collaboration
+        """,
+    'story': """
+        **The Problem**: Existing AI assistants require internet connectivity and send all your
+        data to external servers. This creates privacy concerns, especially for sensitive work
+        or personal conversations.
+
+        **The Solution**: DIV-AI was born from the need for a truly private AI assistant that
+        runs entirely on your local machine. No data ever leaves your computer, yet you get
+        professional-quality AI assistance.
+
+        **The Journey**: Months of optimization, testing, and refinement went into making
+        DIV-AI both powerful and accessible to everyday users with regular hardware.
+        """,
+    'philosophy': """
+        **Privacy First**: Your data belongs to you, not to big tech companies.
+
+        **Quality Without Compromise**: Offline doesn't mean inferior. DIV-AI delivers
+        professional-grade AI assistance locally.
+
+        **Accessibility**: Advanced AI shouldn't require expensive hardware or technical
+        expertise to use.
+
+        **Community Driven**: User feedback shapes the development of new features and improvements.
+
+        **Open & Transparent**: The interface code is open source for complete transparency.
+        """,
+    'cards': [
+        ("Multi-Platform Support", "Linux and macOS versions in development"),
+        ("Enhanced Models", "Larger and more specialized AI models"),
+        ("Voice Integration", "Speech-to-text and text-to-speech capabilities"),
+        ("Plugin System", "Extensible architecture for custom features"),
+        ("Mobile Version", "Android app for on-the-go AI assistance"),
+        ("Enterprise Features", "Advanced tools for business users"),
+    ],
+    'support': """
+    **Want to support DIV-AI development?**
+
+    - **Star the project** on GitHub
+    - **Report bugs** and suggest features
+    - **Share DIV-AI** with friends who value privacy
+    - **Join the community** discussions
+    - **Buy me a coffee** (donation links coming soon!)
+
+    Your support helps keep DIV-AI free and continuously improving!
+    """,
+}
+
+PAGES = {
+    "Home": HOME,
+    "Features": FEATURES,
+    "Comparison": COMPARISON,
+    "Screenshots": SCREENSHOTS,
+    "Technical Specs": TECHNICAL_SPECS,
+    "Download": DOWNLOAD,
+    "FAQ": FAQ,
+    "About Creator": ABOUT_CREATOR,
+}
+
+
+def build_page_content(page):
+    """Render one page's static blocks - card lists become HTML, tables DataFrames"""
+    content = dict(PAGES[page])
+    if 'cards' in content:
+        content['cards'] = feature_cards(content['cards'])
+    if 'stats' in content:
+        content['stats'] = stat_boxes(content['stats'])
+    if 'table' in content:
+        content['table'] = pd.DataFrame(content['table'])
+    return content
@@ -0,0 +1,140 @@
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from profiling import timer
+
+# Database location - can be overridden from .env
+DB_PATH = os.getenv('DIV_AI_DB_PATH', 'div_ai_emails.db')
+
+# Pragmas applied to every pooled connection.
+# WAL lets admin reads run while visitors are writing, NORMAL sync is safe
+# with WAL and avoids an fsync per commit.
+PRAGMAS = (
+    ('journal_mode', 'WAL'),
+    ('synchronous', 'NORMAL'),
+    ('busy_timeout', 5000),
+    ('cache_size', -16000),      # ~16MB page cache per connection
+    ('mmap_size', 134217728),    # 128MB memory-mapped reads
+    ('temp_store', 'MEMORY'),
+    ('foreign_keys', 'ON'),
+)
+
+# Seconds to wait for a connection when every pooled one is checked out
+CHECKOUT_TIMEOUT = 10
+
+
+class PoolExhausted(RuntimeError):
+    """No connection came back to the pool within the checkout timeout"""
+
+
+class ConnectionPool:
+    """Small thread-safe pool of long-lived SQLite connections"""
+
+    def __init__(self, path=DB_PATH, size=4, checkout_timeout=CHECKOUT_TIMEOUT):
+        self.path = path
+        self.size = size
+        self.checkout_timeout = checkout_timeout
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._closed = False
+
+    def _connect(self):
+        with timer('db_connect'):
+            conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            for name, value in PRAGMAS:
+                conn.execute(f'PRAGMA {name} = {value}')
+        return conn
+
+    def _acquire(self):
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                create = True
+            else:
+                create = False
+
+        if create:
+            try:
+                return self._connect()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+
+        # Pool exhausted - wait for another session to hand one back, but not
+        # forever: a leaked or stuck checkout would otherwise hang every session
+        try:
+            return self._idle.get(timeout=self.checkout_timeout)
+        except queue.Empty:
+            raise PoolExhausted(
+                f"All {self.size} database connections stayed busy for {self.checkout_timeout}s"
+            ) from None
+
+    def _release(self, conn):
+        if self._closed:
+            conn.close()
+        else:
+            self._idle.put(conn)
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection; commits on success, rolls back on error"""
+        conn = self._acquire()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._release(conn)
+
+    def close(self):
+        """Close every idle connection and refuse new checkouts"""
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+# One pool per process, shared by every Streamlit session
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """Return the process-wide connection pool, creating it on first use"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(DB_PATH)
+    return _pool
+
+
+def set_database_path(path):
+    """Point the process-wide pool at another database file (tools, benchmarks)"""
+    global DB_PATH, _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+        DB_PATH = path
+        _pool = None
+
+
+def get_connection():
+    """Shortcut for get_pool().connection()"""
+    return get_pool().connection()
@@ -0,0 +1,351 @@
+"""Binary delta updates between two DIV-AI package versions
+
+    python delta.py create DIV-AI-v1.0/ DIV-AI-v1.1/ v1.0-to-v1.1.divdelta
+    python delta.py apply DIV-AI-v1.0/ v1.0-to-v1.1.divdelta DIV-AI-v1.1/
+    python delta.py info v1.0-to-v1.1.divdelta
+
+Versions are package directories (a .zip is extracted to a temp dir
+first). Every file is cut into content-defined chunks - boundaries come
+from a rolling hash over the last 48 bytes, so inserting or removing
+bytes only changes the chunks around the edit instead of shifting every
+fixed-size block after it. A chunk of the new version that already
+exists anywhere in the old version is stored as a reference to its old
+location; only new chunks are stored, zlib-compressed. Unchanged files
+are a single "same" entry.
+
+File layout: MAGIC, the chunk payload, the JSON header, then the header
+length as 8 bytes big-endian - so the payload can be streamed out while
+the header is still being built. apply() writes the new version into a
+separate directory and checks every file's SHA-256 against the header.
+
+Only create needs numpy; apply and info use nothing but the standard
+library, so this file alone is what users download to patch an install.
+"""
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import time
+import zipfile
+import zlib
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MAGIC = b'DIVDELTA1\n'
+
+# Content-defined chunking: ~64KB average, never below 16KB or above 256KB
+WINDOW = 48
+MIN_CHUNK = 16 * 1024
+MAX_CHUNK = 256 * 1024
+MASK = (1 << 16) - 1
+
+# Bytes scanned per numpy pass, and the copy size when applying
+BLOCK_SIZE = 1024 * 1024
+COPY_SIZE = 1024 * 1024
+
+# Fixed random table so every build finds the same boundaries
+_GEAR_SEED = 0x5EED_D1FF
+
+
+class DeltaError(Exception):
+    """Raised for a delta that is corrupt or doesn't fit the installed version"""
+
+
+def _gear():
+    return np.random.default_rng(_GEAR_SEED).integers(0, 2 ** 32, size=256, dtype=np.uint32)
+
+
+def chunk_boundaries(data, gear=None):
+    """Yield (offset, length) content-defined chunks of a bytes-like object
+
+    The rolling hash at each byte is the sum of gear[b] over the previous
+    WINDOW bytes, computed for a whole block at once from a cumulative
+    sum (uint32 wraparound is fine - only the low bits are used); a
+    boundary is any position where its low 16 bits are zero, subject to
+    MIN_CHUNK/MAX_CHUNK.
+    """
+    gear = _gear() if gear is None else gear
+    size = len(data)
+    start = 0
+    if size > WINDOW:
+        view = np.frombuffer(data, dtype=np.uint8)
+        # Reused across blocks - allocating per block costs more than the hashing
+        summed = np.empty(BLOCK_SIZE + WINDOW, dtype=np.uint32)
+        hashes = np.empty(BLOCK_SIZE, dtype=np.uint32)
+    for block_start in range(0, size if size > WINDOW else 0, BLOCK_SIZE):
+        # Overlap by WINDOW bytes so hashes at the block edge see a full window
+        lo = max(block_start - WINDOW, 0)
+        n = min(block_start + BLOCK_SIZE, size) - lo
+        if n <= WINDOW:
+            break
+        sums, window = summed[:n], hashes[:n - WINDOW]
+        np.take(gear, view[lo:lo + n], out=sums)
+        np.cumsum(sums, out=sums)
+        np.subtract(sums[WINDOW:], sums[:-WINDOW], out=window)   # window ending at lo + WINDOW + i
+        np.bitwise_and(window, MASK, out=window)
+        candidates = np.flatnonzero(window == 0) + (lo + WINDOW + 1)
+        for cut in candidates[candidates > block_start].tolist():
+            while cut - start > MAX_CHUNK:
+                yield start, MAX_CHUNK
+                start += MAX_CHUNK
+            if cut - start >= MIN_CHUNK:
+                yield start, cut - start
+                start = cut
+    while size - start > MAX_CHUNK:
+        yield start, MAX_CHUNK
+        start += MAX_CHUNK
+    if size > start:
+        yield start, size - start
+
+
+def _mapped(path):
+    """Read-only mmap of a file, or b'' for an empty one"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b''
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def scan_file(path, gear):
+    """(whole-file sha256, [(chunk sha256, offset, length)])"""
+    data = _mapped(path)
+    try:
+        whole = hashlib.sha256(data)
+        chunks = [(hashlib.sha256(data[offset:offset + length]).digest(), offset, length)
+                  for offset, length in chunk_boundaries(data, gear)]
+    finally:
+        if data:
+            data.close()
+    return whole.hexdigest(), chunks
+
+
+def scan_sha256(path):
+    """Whole-file sha256 hex digest"""
+    data = _mapped(path)
+    try:
+        return hashlib.sha256(data).hexdigest()
+    finally:
+        if data:
+            data.close()
+
+
+def package_files(root):
+    """Relative '/'-separated paths of every file under a package directory"""
+    files = []
+    for folder, _, names in os.walk(root):
+        for name in names:
+            files.append(os.path.relpath(os.path.join(folder, name), root).replace(os.sep, '/'))
+    return sorted(files)
+
+
+def _package_dir(path, tmp, label):
+    """A directory for a package - extracts .zip files into tmp/label"""
+    if os.path.isdir(path):
+        return path
+    if zipfile.is_zipfile(path):
+        target = os.path.join(tmp, label)
+        with zipfile.ZipFile(path) as archive:
+            archive.extractall(target)
+        return target
+    raise DeltaError(f"{path} is neither a directory nor a zip file")
+
+
+def create_delta(old_path, new_path, delta_path, from_version=None, to_version=None, level=6):
+    """Write a delta that turns `old_path` into `new_path`, returns its header"""
+    if np is None:
+        raise DeltaError("Creating a delta needs numpy (pip install numpy)")
+    gear = _gear()
+    with tempfile.TemporaryDirectory() as tmp:
+        old_dir, new_dir = _package_dir(old_path, tmp, 'old'), _package_dir(new_path, tmp, 'new')
+
+        # Where every chunk of the old version lives
+        old_chunks, old_hashes = {}, {}
+        for name in package_files(old_dir):
+            old_hashes[name], chunks = scan_file(os.path.join(old_dir, *name.split('/')), gear)
+            for digest, offset, length in chunks:
+                old_chunks.setdefault(digest, (name, offset, length))
+
+        header = {
+            'format': 1,
+            'from_version': from_version or os.path.basename(os.path.normpath(old_path)),
+            'to_version': to_version or os.path.basename(os.path.normpath(new_path)),
+            'old_files': old_hashes,
+            'files': [],
+        }
+        stored = {}   # chunk sha -> payload ref, so repeated new chunks are stored once
+        with open(delta_path, 'wb') as out:
+            out.write(MAGIC)
+            payload_size = 0
+            for name in package_files(new_dir):
+                path = os.path.join(new_dir, *name.split('/'))
+                whole, chunks = scan_file(path, gear)
+                entry = {'path': name, 'size': os.path.getsize(path), 'sha256': whole}
+                header['files'].append(entry)
+                if old_hashes.get(name) == whole:
+                    entry['same'] = True
+                    continue
+
+                refs = []
+                data = _mapped(path)
+                try:
+                    for digest, offset, length in chunks:
+                        if digest in old_chunks:
+                            src, src_offset, _ = old_chunks[digest]
+                            last = refs[-1] if refs else None
+                            # Merge runs of chunks that are also contiguous in the old file
+                            if last and last[0] == 'old' and last[1] == src and last[2] + last[3] == src_offset:
+                                last[3] += length
+                            else:
+                                refs.append(['old', src, src_offset, length])
+                        else:
+                            if digest not in stored:
+                                packed = zlib.compress(data[offset:offset + length], level)
+                                out.write(packed)
+                                stored[digest] = [payload_size, len(packed)]
+                                payload_size += len(packed)
+                            refs.append(['new', stored[digest][0], stored[digest][1], length])
+                finally:
+                    if data:
+                        data.close()
+                entry['refs'] = refs
+
+            header['payload_size'] = payload_size
+            raw_header = json.dumps(header, separators=(',', ':')).encode()
+            out.write(raw_header)
+            out.write(struct.pack('>Q', len(raw_header)))
+    return header
+
+
+def read_header(delta_path):
+    """The JSON header of a delta file"""
+    with open(delta_path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise DeltaError(f"{delta_path} is not a DIV-AI delta")
+        f.seek(-8, os.SEEK_END)
+        (length,) = struct.unpack('>Q', f.read(8))
+        f.seek(-8 - length, os.SEEK_END)
+        return json.loads(f.read(length))
+
+
+def _package_path(root, name):
+    """Join a header path onto root, rejecting any that would leave it"""
+    parts = name.split('/')
+    if (not name or '\\' in name or ':' in name
+            or any(part in ('', '.', '..') for part in parts)):
+        raise DeltaError(f"Unsafe path in delta: {name!r}")
+    return os.path.join(root, *parts)
+
+
+def _copy_range(src, dst, offset, length, digest):
+    src.seek(offset)
+    while length:
+        block = src.read(min(COPY_SIZE, length))
+        if not block:
+            raise DeltaError("Installed file is shorter than the delta expects")
+        dst.write(block)
+        digest.update(block)
+        length -= len(block)
+
+
+def apply_delta(old_dir, delta_path, out_dir, verify_old=True):
+    """Build the new version in `out_dir` from the installed `old_dir`, returns the header"""
+    header = read_header(delta_path)
+    if verify_old:
+        for name, expected in header['old_files'].items():
+            path = _package_path(old_dir, name)
+            if not os.path.exists(path) or scan_sha256(path) != expected:
+                raise DeltaError(f"{name} doesn't match {header['from_version']} - download the full package")
+
+    os.makedirs(out_dir, exist_ok=True)
+    old_files = {}
+    with open(delta_path, 'rb') as delta:
+        try:
+            for entry in header['files']:
+                target = _package_path(out_dir, entry['path'])
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                if entry.get('same'):
+                    shutil.copyfile(_package_path(old_dir, entry['path']), target)
+                    continue
+
+                digest = hashlib.sha256()
+                with open(target, 'wb') as out:
+                    for ref in entry['refs']:
+                        if ref[0] == 'old':
+                            _, name, offset, length = ref
+                            if name not in old_files:
+                                old_files[name] = open(_package_path(old_dir, name), 'rb')
+                            _copy_range(old_files[name], out, offset, length, digest)
+                        else:
+                            _, offset, packed_length, length = ref
+                            delta.seek(len(MAGIC) + offset)
+                            block = zlib.decompress(delta.read(packed_length))
+                            if len(block) != length:
+                                raise DeltaError("Corrupt chunk in delta")
+                            out.write(block)
+                            digest.update(block)
+                if digest.hexdigest() != entry['sha256']:
+                    raise DeltaError(f"{entry['path']} failed its checksum after patching")
+        finally:
+            for f in old_files.values():
+                f.close()
+    return header
+
+
+def summarize(header, delta_size):
+    """(new version bytes, delta bytes, files changed, files unchanged)"""
+    total = sum(entry['size'] for entry in header['files'])
+    changed = sum(not entry.get('same') for entry in header['files'])
+    return total, delta_size, changed, len(header['files']) - changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+    create = commands.add_parser('create', help='build a delta between two package versions')
+    create.add_argument('old')
+    create.add_argument('new')
+    create.add_argument('delta')
+    create.add_argument('--from-version')
+    create.add_argument('--to-version')
+    apply = commands.add_parser('apply', help='patch an installed version into a new directory')
+    apply.add_argument('old')
+    apply.add_argument('delta')
+    apply.add_argument('out')
+    info = commands.add_parser('info', help='describe a delta')
+    info.add_argument('delta')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        if args.command == 'create':
+            header = create_delta(args.old, args.new, args.delta, args.from_version, args.to_version)
+            delta_path = args.delta
+        elif args.command == 'apply':
+            if os.path.abspath(args.out) == os.path.abspath(args.old):
+                sys.exit("Write the new version to a separate directory, then swap it in")
+            header = apply_delta(args.old, args.delta, args.out)
+            delta_path = args.delta
+        else:
+            header = read_header(args.delta)
+            delta_path = args.delta
+    except DeltaError as e:
+        sys.exit(f"{args.command} failed: {e}")
+
+    total, delta_size, changed, same = summarize(header, os.path.getsize(delta_path))
+    print(f"{header['from_version']} -> {header['to_version']}: {changed} files changed, {same} unchanged")
+    print(f"delta {delta_size / 1024 / 1024:,.2f} MB vs full {total / 1024 / 1024:,.1f} MB "
+          f"({100 - delta_size * 100 / max(total, 1):.1f}% saved)")
+    if args.command != 'info':
+        print(f"{args.command} took {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,214 @@
+"""Self-hosted download endpoint for the DIV-AI package
+
+Serves one file from disk over plain HTTP with what a 1.65GB download
+needs: Range requests so browsers and download managers can resume,
+If-Range so a resume never splices two different builds together,
+strong ETags and Last-Modified for caches, and a cap on concurrent
+transfers (extra clients get 503 + Retry-After). Bodies go out through
+socket.sendfile(), i.e. os.sendfile() zero-copy where the OS has it;
+--no-sendfile streams from an mmap instead, for comparison.
+
+    python download_server.py /srv/DIV-AI-v1.0.zip --port 8502 --max-transfers 16
+
+Then point the site at it (behind your reverse proxy / TLS as needed):
+
+    DIV_AI_DOWNLOAD_URL=https://example.com/downloads/DIV-AI-v1.0.zip
+"""
+import argparse
+import mimetypes
+import mmap
+import os
+import threading
+from email.utils import formatdate, parsedate_to_datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+MAX_TRANSFERS = int(os.getenv('DIV_AI_DOWNLOAD_MAX_TRANSFERS', '16'))
+
+# Chunk size for the mmap fallback
+MMAP_CHUNK = 1024 * 1024
+
+
+def parse_range(header, size):
+    """(start, end) inclusive for a single 'bytes=' range
+
+    Returns None when the header should be ignored (other units, several
+    ranges, bad syntax - the whole file is sent) and raises ValueError
+    when the range can't be satisfied (416).
+    """
+    units, _, spec = header.partition('=')
+    if units.strip().lower() != 'bytes' or ',' in spec:
+        return None
+    first, sep, last = spec.strip().partition('-')
+    if not sep or not (first.isdigit() or last.isdigit()):
+        return None
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            raise ValueError(header)
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = int(last) if last else size - 1
+    if last and end < start:
+        return None
+    if start >= size:
+        raise ValueError(header)
+    return start, min(end, size - 1)
+
+
+def make_etag(stat):
+    """Strong validator from size and mtime - changes whenever the file is replaced"""
+    return f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+
+
+class DownloadHandler(BaseHTTPRequestHandler):
+    """GET/HEAD for the one package file"""
+
+    server_version = 'DIV-AI-Download/1.0'
+    protocol_version = 'HTTP/1.1'
+    timeout = 60
+
+    def do_HEAD(self):
+        self._serve(head=True)
+
+    def do_GET(self):
+        self._serve(head=False)
+
+    def _if_range_matches(self, etag, stat):
+        """True if a Range may be honoured - no If-Range, or it still validates"""
+        validator = self.headers.get('If-Range')
+        if not validator:
+            return True
+        validator = validator.strip()
+        if validator.startswith(('"', 'W/')):
+            return validator == etag
+        try:
+            return int(parsedate_to_datetime(validator).timestamp()) == int(stat.st_mtime)
+        except (TypeError, ValueError):
+            return False
+
+    def _send_empty(self, status, headers=()):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def _serve(self, head):
+        server = self.server
+        if unquote(urlsplit(self.path).path) not in ('/', '/' + server.file_name):
+            return self._send_empty(HTTPStatus.NOT_FOUND)
+        try:
+            f = open(server.package_path, 'rb')
+        except OSError:
+            return self._send_empty(HTTPStatus.NOT_FOUND)
+
+        with f:
+            stat = os.fstat(f.fileno())
+            size = stat.st_size
+            etag = make_etag(stat)
+            validators = (('ETag', etag), ('Last-Modified', formatdate(stat.st_mtime, usegmt=True)))
+
+            if etag in [tag.strip() for tag in self.headers.get('If-None-Match', '').split(',')]:
+                return self._send_empty(HTTPStatus.NOT_MODIFIED, validators)
+
+            start, end, status = 0, size - 1, HTTPStatus.OK
+            range_header = self.headers.get('Range')
+            if range_header and self._if_range_matches(etag, stat):
+                try:
+                    requested = parse_range(range_header, size)
+                except ValueError:
+                    return self._send_empty(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE,
+                                            [('Content-Range', f'bytes */{size}')])
+                if requested:
+                    start, end = requested
+                    status = HTTPStatus.PARTIAL_CONTENT
+
+            if not head and not server.transfers.acquire(blocking=False):
+                return self._send_empty(HTTPStatus.SERVICE_UNAVAILABLE, [('Retry-After', '5')])
+            try:
+                self.send_response(status)
+                self.send_header('Content-Type', server.content_type)
+                self.send_header('Content-Length', str(end - start + 1))
+                self.send_header('Content-Disposition', f'attachment; filename="{server.file_name}"')
+                self.send_header('Accept-Ranges', 'bytes')
+                self.send_header('Cache-Control', 'public, max-age=3600')
+                for name, value in validators:
+                    self.send_header(name, value)
+                if status == HTTPStatus.PARTIAL_CONTENT:
+                    self.send_header('Content-Range', f'bytes {start}-{end}/{size}')
+                self.end_headers()
+                if not head and size:
+                    self._send_body(f, start, end - start + 1)
+            except (BrokenPipeError, ConnectionResetError):
+                # Client went away mid-transfer; it can resume with a Range
+                self.close_connection = True
+            finally:
+                if not head:
+                    server.transfers.release()
+
+    def _send_body(self, f, offset, count):
+        if self.server.zero_copy:
+            self.connection.sendfile(f, offset, count)
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                for chunk_start in range(offset, offset + count, MMAP_CHUNK):
+                    self.wfile.write(view[chunk_start:min(chunk_start + MMAP_CHUNK, offset + count)])
+            finally:
+                view.release()
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class DownloadServer(ThreadingHTTPServer):
+    """Threaded HTTP server for one file with a concurrent-transfer cap"""
+
+    daemon_threads = True
+
+    def __init__(self, address, package_path, max_transfers=MAX_TRANSFERS, zero_copy=True, verbose=False):
+        self.package_path = os.path.abspath(package_path)
+        self.file_name = os.path.basename(self.package_path)
+        self.content_type = mimetypes.guess_type(self.file_name)[0] or 'application/octet-stream'
+        self.transfers = threading.BoundedSemaphore(max_transfers)
+        self.zero_copy = zero_copy
+        self.verbose = verbose
+        super().__init__(address, DownloadHandler)
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}/{self.file_name}'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('path', help='package file to serve')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8502)
+    parser.add_argument('--max-transfers', type=int, default=MAX_TRANSFERS)
+    parser.add_argument('--no-sendfile', action='store_true', help='stream from mmap instead of sendfile')
+    parser.add_argument('--quiet', action='store_true', help="don't log requests")
+    args = parser.parse_args()
+
+    if not os.path.isfile(args.path):
+        parser.error(f"{args.path} is not a file")
+    server = DownloadServer((args.host, args.port), args.path, args.max_transfers,
+                            zero_copy=not args.no_sendfile, verbose=not args.quiet)
+    print(f"Serving {server.package_path} at {server.url}")
+    print("Set DIV_AI_DOWNLOAD_URL to that URL (or your proxy's) to link it from the Download page")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
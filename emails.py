@@ -0,0 +1,391 @@
+import atexit
+import logging
+import os
+import threading
+from datetime import datetime
+
+from database import get_connection
+from lazy_imports import lazy_import
+from profiling import timed, timer
+
+pd = lazy_import('pandas')
+
+logger = logging.getLogger(__name__)
+
+
+def domain_sql(column):
+    """SQL expression for the part after '@', matching email.split('@')[1]"""
+    return (f"CASE WHEN instr({column}, '@') > 0 "
+            f"THEN substr({column}, instr({column}, '@') + 1) ELSE 'unknown' END")
+
+
+# download_count is a compacted cache; add the events logged since the last
+# compaction so listings and exports are never behind the stats tiles
+DOWNLOAD_COUNT_SQL = '''download_count + (
+        SELECT COUNT(*) FROM download_events
+        WHERE email_id = user_emails.id
+          AND id > (SELECT last_event_id FROM event_compaction)
+    )'''
+
+
+def normalized_email_sql(column):
+    """SQL expression for an email with any +tag dropped from the local part"""
+    return (f"CASE WHEN instr({column}, '+') > 0 AND instr({column}, '+') < instr({column}, '@') "
+            f"THEN substr({column}, 1, instr({column}, '+') - 1) || substr({column}, instr({column}, '@')) "
+            f"ELSE {column} END")
+
+
+# New addresses start at download_count 0 - their downloads are logged in
+# download_events and folded into the counter by compact_download_events()
+INSERT_EMAIL_SQL = f'''
+    INSERT INTO user_emails (email, timestamp, download_count, domain, email_normalized)
+    VALUES (?1, ?2, 0, {domain_sql('?1')}, {normalized_email_sql('?1')})
+    ON CONFLICT(email) DO NOTHING
+'''
+
+DOWNLOAD_EVENT_SQL = '''
+    INSERT INTO download_events (email_id, ts, ua_hash)
+    SELECT id, ?2, ?3 FROM user_emails WHERE email = ?1
+'''
+
+# Bulk imports bring their own count and have no events behind them, and
+# leave existing rows alone so importing a list twice changes nothing
+IMPORT_EMAIL_SQL = f'''
+    INSERT INTO user_emails (email, timestamp, download_count, domain, email_normalized)
+    VALUES (?1, ?2, ?3, {domain_sql('?1')}, {normalized_email_sql('?1')})
+    ON CONFLICT(email) DO NOTHING
+'''
+
+# Write-behind flush interval in milliseconds, 0 disables the queue
+WRITE_BEHIND_MS = int(os.getenv('DIV_AI_WRITE_BEHIND_MS', '0'))
+
+# Seconds between folding download_events into download_count, 0 disables it
+COMPACT_SECONDS = int(os.getenv('DIV_AI_COMPACT_SECONDS', '60'))
+
+
+@timed('record_downloads')
+def record_downloads(events):
+    """Log many (email, timestamp, ua_hash) downloads in one transaction
+
+    Unknown addresses are added first. Every download is a new row in
+    download_events, so repeat downloads keep their own time and never
+    update a shared row.
+    """
+    events = [(email.lower(), ts, ua_hash) for email, ts, ua_hash in events]
+    with get_connection() as conn:
+        conn.executemany(INSERT_EMAIL_SQL, [(email, ts) for email, ts, _ in events])
+        conn.executemany(DOWNLOAD_EVENT_SQL, events)
+    # Imported here - lookup reads DOWNLOAD_COUNT_SQL from this module
+    from lookup import invalidate_emails
+    invalidate_emails(email for email, _, _ in events)
+
+
+def upsert_email(email, timestamp=None, ua_hash=None):
+    """Record one download, adding the email if it's new"""
+    record_downloads([(email, timestamp or datetime.now().isoformat(), ua_hash)])
+
+
+@timed('compact_download_events')
+def compact_download_events():
+    """Fold events logged since the last run into download_count, returns how many"""
+    with get_connection() as conn:
+        # Take the write lock first so two processes can't fold the same events
+        conn.execute('BEGIN IMMEDIATE')
+        last = conn.execute('SELECT last_event_id FROM event_compaction WHERE id = 1').fetchone()[0]
+        upto = conn.execute('SELECT COALESCE(MAX(id), 0) FROM download_events').fetchone()[0]
+        if upto <= last:
+            return 0
+        counts = conn.execute(
+            'SELECT COUNT(*), email_id FROM download_events WHERE id > ? AND id <= ? GROUP BY email_id',
+            (last, upto)
+        ).fetchall()
+        conn.executemany('UPDATE user_emails SET download_count = download_count + ? WHERE id = ?', counts)
+        conn.execute('UPDATE event_compaction SET last_event_id = ? WHERE id = 1', (upto,))
+    return upto - last
+
+
+def get_email_stats(conn=None):
+    """Return (total_emails, total_downloads) from the stats summary row"""
+    if conn is None:
+        with timer('get_email_stats'), get_connection() as conn:
+            return get_email_stats(conn)
+    row = conn.execute('SELECT total_emails, total_downloads FROM stats WHERE id = 1').fetchone()
+    return row if row else (0, 0)
+
+
+def get_email_generation():
+    """Counter that changes whenever user_emails or download_events is written"""
+    with get_connection() as conn:
+        row = conn.execute('SELECT generation FROM email_generation WHERE id = 1').fetchone()
+    return row[0] if row else 0
+
+
+@timed('get_daily_stats')
+def get_daily_stats(day):
+    """Return (new_emails, downloads) for a YYYY-MM-DD day"""
+    with get_connection() as conn:
+        row = conn.execute('SELECT new_emails, downloads FROM daily_stats WHERE day = ?', (day,)).fetchone()
+    return row if row else (0, 0)
+
+
+def _email_page_query(page_size, cursor=None, search=None):
+    """Build the keyset-paginated listing query, fetching one extra row"""
+    where, params = [], []
+    if search:
+        prefix = search.strip().lower()
+        if prefix.startswith('@'):
+            # "@gmail" searches the indexed domain column instead
+            column, prefix = 'domain', prefix[1:]
+        else:
+            column = 'email'
+        where.append(f'{column} >= ? AND {column} < ?')
+        params += [prefix, prefix + '\uffff']
+    if cursor:
+        where.append('(timestamp, id) < (?, ?)')
+        params += list(cursor)
+
+    sql = f'SELECT id, email, timestamp, {DOWNLOAD_COUNT_SQL} AS download_count FROM user_emails'
+    if where:
+        sql += ' WHERE ' + ' AND '.join(where)
+    sql += ' ORDER BY timestamp DESC, id DESC'
+    if page_size:
+        sql += ' LIMIT ?'
+        params.append(page_size + 1)
+    return sql, params
+
+
+def get_email_page(page_size=50, cursor=None, search=None):
+    """Return one page of emails newest first and the cursor for the next page
+
+    Uses keyset pagination on (timestamp, id) so every page costs the same
+    no matter how deep the admin scrolls. `search` is an email prefix (or
+    "@domain" prefix) and is turned into a range over the matching index.
+    """
+    sql, params = _email_page_query(page_size, cursor, search)
+    with get_connection() as conn:
+        rows = conn.execute(sql, params).fetchall()
+
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_cursor = (rows[-1][2], rows[-1][0])
+    return rows, next_cursor
+
+
+@timed('email_dataframe')
+def email_dataframe(df):
+    """Rename raw user_emails columns for display and add a Readable Date
+
+    The date is parsed for the whole column at once. Timestamps are stored
+    by datetime.isoformat(), so the first 19 characters always match one
+    fixed format and fractional seconds are not shown anyway.
+    """
+    df = df.rename(columns={
+        'id': 'ID',
+        'email': 'Email',
+        'timestamp': 'Timestamp',
+        'download_count': 'Download Count',
+    })
+    df['Download Count'] = df['Download Count'].fillna(1).astype('int64')
+    parsed = pd.to_datetime(df['Timestamp'].str.slice(0, 19), format='%Y-%m-%dT%H:%M:%S', errors='coerce')
+    df['Readable Date'] = parsed.dt.strftime('%Y-%m-%d %H:%M:%S')
+    return df
+
+
+@timed('get_email_page_dataframe')
+def get_email_page_dataframe(page_size=50, cursor=None, search=None):
+    """Same as get_email_page but loads the page straight into a DataFrame"""
+    sql, params = _email_page_query(page_size, cursor, search)
+    with get_connection() as conn:
+        df = pd.read_sql_query(sql, conn, params=params)
+
+    next_cursor = None
+    if page_size and len(df) > page_size:
+        df = df.iloc[:page_size]
+        next_cursor = (df['timestamp'].iloc[-1], int(df['id'].iloc[-1]))
+    return email_dataframe(df), next_cursor
+
+
+def get_all_emails_dataframe():
+    """Every email row as a display-ready DataFrame, newest first"""
+    df, _ = get_email_page_dataframe(None)
+    return df
+
+
+@timed('get_domain_counts')
+def get_domain_counts(top_n=10, since=None):
+    """Return [(domain, count)] for the most common domains
+
+    `since` is an optional ISO timestamp; only signups at or after it are
+    counted. Runs as a GROUP BY over the domain index.
+    """
+    sql = 'SELECT domain, COUNT(*) AS count FROM user_emails'
+    params = []
+    if since:
+        sql += ' WHERE timestamp >= ?'
+        params.append(since)
+    sql += ' GROUP BY domain ORDER BY count DESC, domain LIMIT ?'
+    params.append(top_n)
+
+    with get_connection() as conn:
+        return conn.execute(sql, params).fetchall()
+
+
+# granularity -> (rollup table, key column, key length, bucket expression, bucket format)
+ACTIVITY_GRANULARITIES = {
+    'Hour': ('hourly_stats', 'hour', 13, 'hour', '%Y-%m-%dT%H'),
+    'Day': ('daily_stats', 'day', 10, 'day', '%Y-%m-%d'),
+    'Month': ('daily_stats', 'day', 10, 'substr(day, 1, 7)', '%Y-%m'),
+}
+
+
+def get_activity(granularity='Day', since=None):
+    """Return [(bucket, new_emails, downloads)] oldest first
+
+    Reads the trigger-maintained hourly_stats/daily_stats rollups, so a
+    year of history is at most a few thousand rows no matter how many
+    emails there are. `since` is an optional ISO timestamp.
+    """
+    table, key, key_length, bucket, _ = ACTIVITY_GRANULARITIES[granularity]
+    sql = f'SELECT {bucket} AS bucket, SUM(new_emails), SUM(downloads) FROM {table}'
+    params = []
+    if since:
+        sql += f' WHERE {key} >= ?'
+        params.append(since[:key_length])
+    sql += ' GROUP BY bucket ORDER BY bucket'
+
+    with get_connection() as conn:
+        return conn.execute(sql, params).fetchall()
+
+
+@timed('get_activity_dataframe')
+def get_activity_dataframe(granularity='Day', since=None):
+    """get_activity as a chart-ready DataFrame indexed by bucket start
+
+    Buckets with no activity are missing from the rollups, so the index is
+    filled out to a continuous range with zeros up to now.
+    """
+    rows = get_activity(granularity, since)
+    fmt = ACTIVITY_GRANULARITIES[granularity][4]
+    df = pd.DataFrame(rows, columns=['Bucket', 'New Emails', 'Downloads'])
+    if df.empty:
+        return df.set_index('Bucket')
+    df.index = pd.to_datetime(df.pop('Bucket'), format=fmt)
+
+    def bucket_start(timestamp):
+        return pd.to_datetime(timestamp[:len(datetime.now().strftime(fmt))], format=fmt)
+
+    step = {'Hour': pd.Timedelta(hours=1), 'Day': pd.Timedelta(days=1), 'Month': pd.offsets.MonthBegin()}[granularity]
+    start = bucket_start(since) if since else df.index[0]
+    end = max(bucket_start(datetime.now().isoformat()), df.index[-1])
+    return df.reindex(pd.date_range(start, end, freq=step), fill_value=0)
+
+
+class WriteBehindQueue:
+    """Batch download events and write them in one transaction per tick"""
+
+    def __init__(self, interval_ms=WRITE_BEHIND_MS):
+        self.interval = interval_ms / 1000
+        self._pending = []   # (email, timestamp, ua_hash)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name='email-write-behind', daemon=True)
+        self._thread.start()
+
+    def submit(self, email, timestamp=None, ua_hash=None):
+        """Queue a download; it will be written on the next flush"""
+        timestamp = timestamp or datetime.now().isoformat()
+        with self._lock:
+            self._pending.append((email, timestamp, ua_hash))
+
+    def flush(self):
+        """Write everything queued so far, returns the number of events written"""
+        with self._lock:
+            batch, self._pending = self._pending, []
+        if not batch:
+            return 0
+
+        try:
+            record_downloads(batch)
+        except Exception:
+            logger.exception("Write-behind flush failed, re-queueing %d downloads", len(batch))
+            with self._lock:
+                self._pending[:0] = batch
+            return 0
+        return len(batch)
+
+    def _run(self):
+        while not self._stopped:
+            self._wake.wait(self.interval)
+            self.flush()
+
+    def stop(self):
+        """Stop the background thread and write out anything still queued"""
+        self._stopped = True
+        self._wake.set()
+        self._thread.join()
+        self.flush()
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def set_write_behind_interval(interval_ms):
+    """Set the write-behind interval, 0 disables it - call before the first save"""
+    global WRITE_BEHIND_MS
+    WRITE_BEHIND_MS = interval_ms
+
+
+def get_write_queue():
+    """Return the process-wide write-behind queue, or None if disabled"""
+    global _queue
+    if WRITE_BEHIND_MS <= 0:
+        return None
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                _queue = WriteBehindQueue(WRITE_BEHIND_MS)
+                atexit.register(_queue.stop)
+    return _queue
+
+
+class EventCompactor:
+    """Background thread running compact_download_events every interval"""
+
+    def __init__(self, interval_seconds=COMPACT_SECONDS):
+        self.interval = interval_seconds
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name='download-compactor', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stopped:
+            self._wake.wait(self.interval)
+            try:
+                compact_download_events()
+            except Exception:
+                logger.exception("Download event compaction failed")
+
+    def stop(self):
+        """Stop the background thread after one last compaction"""
+        self._stopped = True
+        self._wake.set()
+        self._thread.join()
+
+
+_compactor = None
+
+
+def start_event_compactor(interval_seconds=COMPACT_SECONDS):
+    """Start the process-wide compactor once, returns it (None if disabled)"""
+    global _compactor
+    if interval_seconds <= 0:
+        return None
+    with _queue_lock:
+        if _compactor is None:
+            _compactor = EventCompactor(interval_seconds)
+            atexit.register(_compactor.stop)
+    return _compactor
@@ -0,0 +1,141 @@
+import csv
+import gzip
+import io
+import json
+import tempfile
+from datetime import datetime
+
+from database import get_connection
+from emails import DOWNLOAD_COUNT_SQL
+from lazy_imports import is_available, lazy_import
+from profiling import timed
+
+pa = lazy_import('pyarrow')
+pq = lazy_import('pyarrow.parquet')
+
+# Rows pulled from SQLite per fetchmany() call
+CHUNK_SIZE = 5000
+
+# Exports stay in memory up to this size, then spill to a temp file on disk
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+EXPORT_COLUMNS = ['ID', 'Email', 'Timestamp', 'Download Count', 'Readable Date']
+
+# format name -> (file extension, mime type)
+EXPORT_FORMATS = {
+    'CSV': ('csv', 'text/csv'),
+    'JSON': ('json', 'application/json'),
+    'NDJSON': ('ndjson', 'application/x-ndjson'),
+    'Parquet': ('parquet', 'application/vnd.apache.parquet'),
+}
+
+
+def available_formats():
+    """Export formats usable in this install - Parquet needs pyarrow"""
+    formats = ['CSV', 'JSON', 'NDJSON']
+    if is_available('pyarrow'):
+        formats.append('Parquet')
+    return formats
+
+
+def iter_email_chunks(chunk_size=CHUNK_SIZE):
+    """Yield lists of export rows from user_emails, newest first"""
+    with get_connection() as conn:
+        cursor = conn.execute(
+            f'SELECT id, email, timestamp, {DOWNLOAD_COUNT_SQL} AS download_count '
+            'FROM user_emails ORDER BY timestamp DESC, id DESC'
+        )
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            # Same Readable Date as the admin table, without parsing each row
+            yield [(id_, email, ts, count, ts[:19].replace('T', ' ')) for id_, email, ts, count in rows]
+
+
+def _write_csv(out, chunks):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    for rows in chunks:
+        writer.writerows(rows)
+        out.write(buffer.getvalue().encode('utf-8'))
+        buffer.seek(0)
+        buffer.truncate()
+    out.write(buffer.getvalue().encode('utf-8'))
+
+
+def _write_json(out, chunks, lines=False):
+    first = True
+    if not lines:
+        out.write(b'[')
+    for rows in chunks:
+        records = [json.dumps(dict(zip(EXPORT_COLUMNS, row))) for row in rows]
+        if lines:
+            text = '\n'.join(records) + '\n'
+        else:
+            text = ('\n  ' if first else ',\n  ') + ',\n  '.join(records)
+        out.write(text.encode('utf-8'))
+        first = False
+    if not lines:
+        out.write(b']\n' if first else b'\n]\n')
+
+
+def _write_parquet(out, chunks):
+    schema = pa.schema([
+        ('ID', pa.int64()),
+        ('Email', pa.string()),
+        ('Timestamp', pa.string()),
+        ('Download Count', pa.int64()),
+        ('Readable Date', pa.string()),
+    ])
+    with pq.ParquetWriter(out, schema, compression='snappy') as writer:
+        for rows in chunks:
+            columns = list(zip(*rows))
+            writer.write_table(pa.Table.from_arrays([list(col) for col in columns], schema=schema))
+
+
+def _reporting(chunks, progress):
+    rows = 0
+    for chunk in chunks:
+        yield chunk
+        rows += len(chunk)
+        progress(rows)
+
+
+@timed('export_emails')
+def export_emails(fmt='CSV', compress=False, chunk_size=CHUNK_SIZE, progress=None):
+    """Stream user_emails into a spooled temp file
+
+    Rows are read in chunks and written straight out, so memory use stays
+    flat no matter how big the table is. Returns (file, file_name, mime)
+    with the file rewound to the start. Parquet is compressed internally,
+    so `compress` only applies to the text formats. `progress`, if given,
+    is called with the number of rows read so far after every chunk.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    extension, mime = EXPORT_FORMATS[fmt]
+    compress = compress and fmt != 'Parquet'
+
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    out = gzip.GzipFile(fileobj=spool, mode='wb') if compress else spool
+    chunks = iter_email_chunks(chunk_size)
+    if progress:
+        chunks = _reporting(chunks, progress)
+
+    if fmt == 'CSV':
+        _write_csv(out, chunks)
+    elif fmt == 'Parquet':
+        _write_parquet(out, chunks)
+    else:
+        _write_json(out, chunks, lines=fmt == 'NDJSON')
+
+    if compress:
+        out.close()
+        extension += '.gz'
+        mime = 'application/gzip'
+    spool.seek(0)
+
+    file_name = f"div_ai_emails_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+    return spool, file_name, mime
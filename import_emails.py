@@ -0,0 +1,212 @@
+"""Bulk import of signup lists into div_ai_emails.db
+
+Streams a CSV file line by line, validates addresses in batches and
+writes each batch with one executemany() UPSERT inside a single
+transaction. The byte offset reached is checkpointed in import_progress
+in that same transaction, so an interrupted import of a multi-million
+row file picks up after the last committed batch when run again.
+
+Imports are idempotent: addresses are lowercased and ones already in the
+database are left alone, so re-running a file (or overlapping lists)
+doesn't inflate totals. Imported rows carry a download count of 1 but no
+download_events, since the list has no real download times.
+
+    python import_emails.py signups.csv
+    python import_emails.py signups.csv --column "Email Address" --batch-size 50000
+    python import_emails.py signups.csv --restart   # ignore a saved checkpoint
+"""
+import argparse
+import csv
+import os
+import sys
+import time
+from datetime import datetime
+
+from database import get_connection
+from emails import IMPORT_EMAIL_SQL
+from lookup import invalidate_emails
+from validation import validate_emails
+
+BATCH_SIZE = 20000
+
+
+class CSVImportError(Exception):
+    """Raised for a file that can't be imported as asked"""
+
+
+def _csv_rows(f, offset, encoding):
+    """Yield (row, byte offset after the row) from a binary file"""
+    def lines():
+        nonlocal offset
+        for raw in f:
+            offset += len(raw)
+            yield raw.decode(encoding)
+
+    for row in csv.reader(lines()):
+        yield row, offset
+
+
+def _find_column(header, column):
+    """Index of `column` in the header - a name (case-insensitive) or a number"""
+    if isinstance(column, int) or str(column).isdigit():
+        return int(column)
+    names = [name.strip().lower() for name in header]
+    if column.lower() not in names:
+        raise CSVImportError(f"No '{column}' column, found: {', '.join(header)}")
+    return names.index(column.lower())
+
+
+def _load_progress(conn, source):
+    return conn.execute(
+        'SELECT file_size, file_mtime, byte_offset, rows_read, rows_imported, rows_invalid, completed '
+        'FROM import_progress WHERE source = ?', (source,)
+    ).fetchone()
+
+
+def _save_progress(conn, source, file_size, file_mtime, stats, completed=False):
+    conn.execute('''
+        INSERT INTO import_progress (source, file_size, file_mtime, byte_offset, rows_read,
+                                     rows_imported, rows_invalid, completed, updated)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(source) DO UPDATE SET
+            file_size = excluded.file_size, file_mtime = excluded.file_mtime,
+            byte_offset = excluded.byte_offset, rows_read = excluded.rows_read,
+            rows_imported = excluded.rows_imported, rows_invalid = excluded.rows_invalid,
+            completed = excluded.completed, updated = excluded.updated
+    ''', (source, file_size, file_mtime, stats['byte_offset'], stats['rows_read'],
+          stats['rows_imported'], stats['rows_invalid'], int(completed), datetime.now().isoformat()))
+
+
+def _clean_batch(batch):
+    """Lowercase, validate and dedupe a batch - returns (unique valid emails, invalid count)"""
+    emails = set()
+    invalid = 0
+    for email, ok in validate_emails(email.strip().lower() for email in batch):
+        if ok:
+            emails.add(email)
+        else:
+            invalid += 1
+    return emails, invalid
+
+
+def import_emails(f, column='email', header=True, batch_size=BATCH_SIZE, source=None,
+                  file_size=0, file_mtime=0, encoding='utf-8-sig', progress=None):
+    """Import emails from an open binary CSV file, returns the final counts
+
+    With a `source` (the file's absolute path), progress is checkpointed
+    after every batch and a previous partial import of the same unchanged
+    file is resumed; if the file has changed since, it is imported from the
+    start again. `progress` is called with the counts after each batch.
+    """
+    stats = {'byte_offset': 0, 'rows_read': 0, 'rows_imported': 0, 'rows_invalid': 0,
+             'resumed': False, 'completed': False, 'seconds': 0.0, 'rows_per_second': 0.0}
+    start = time.perf_counter()
+
+    rows = _csv_rows(f, 0, encoding)
+    index = 0 if column == 'email' and not header else None
+    if header:
+        first = next(rows, None)
+        if first is None:
+            return stats
+        index = _find_column(first[0], column)
+        stats['byte_offset'] = first[1]
+    elif index is None:
+        index = _find_column([], column)
+
+    if source:
+        with get_connection() as conn:
+            saved = _load_progress(conn, source)
+        if saved and saved[0] == file_size and saved[1] == file_mtime:
+            if saved[6]:
+                stats.update(byte_offset=saved[2], rows_read=saved[3], rows_imported=saved[4],
+                             rows_invalid=saved[5], resumed=True, completed=True)
+                return stats
+            if saved[2] > stats['byte_offset']:
+                f.seek(saved[2])
+                rows = _csv_rows(f, saved[2], encoding)
+                stats.update(byte_offset=saved[2], rows_read=saved[3], rows_imported=saved[4],
+                             rows_invalid=saved[5], resumed=True)
+
+    rows_at_start = stats['rows_read']
+
+    def flush(batch):
+        emails, invalid = _clean_batch(batch)
+        stats['rows_invalid'] += invalid
+        timestamp = datetime.now().isoformat()
+        # One transaction per batch, checkpoint included
+        with get_connection() as conn:
+            cursor = conn.executemany(IMPORT_EMAIL_SQL, [(email, timestamp, 1) for email in emails])
+            # Addresses already in the database are skipped by DO NOTHING and
+            # don't count - rowcount is only the rows actually inserted
+            stats['rows_imported'] += max(cursor.rowcount, 0)
+            if source:
+                _save_progress(conn, source, file_size, file_mtime, stats)
+        invalidate_emails(emails)
+        stats['seconds'] = time.perf_counter() - start
+        stats['rows_per_second'] = (stats['rows_read'] - rows_at_start) / stats['seconds']
+        if progress:
+            progress(stats)
+
+    batch = []
+    for row, offset in rows:
+        stats['rows_read'] += 1
+        if len(row) > index:
+            batch.append(row[index])
+        elif row:
+            stats['rows_invalid'] += 1
+        stats['byte_offset'] = offset
+        if len(batch) >= batch_size:
+            flush(batch)
+            batch = []
+    flush(batch)
+
+    if source:
+        with get_connection() as conn:
+            _save_progress(conn, source, file_size, file_mtime, stats, completed=True)
+    stats['completed'] = True
+    return stats
+
+
+def import_file(path, restart=False, **kwargs):
+    """Import a CSV file from disk, resuming a previous partial run"""
+    source = os.path.abspath(path)
+    info = os.stat(source)
+    if restart:
+        with get_connection() as conn:
+            conn.execute('DELETE FROM import_progress WHERE source = ?', (source,))
+    with open(source, 'rb') as f:
+        return import_emails(f, source=source, file_size=info.st_size,
+                             file_mtime=info.st_mtime, **kwargs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('path', help='CSV file to import')
+    parser.add_argument('--column', default='email', help='email column name or index (default: email)')
+    parser.add_argument('--no-header', action='store_true', help='the file has no header row')
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    parser.add_argument('--restart', action='store_true', help='ignore any saved checkpoint')
+    args = parser.parse_args()
+
+    from bootstrap import bootstrap
+    bootstrap()
+
+    def report(stats):
+        print(f"{stats['rows_read']:>12,} rows read  {stats['rows_imported']:>12,} imported  "
+              f"{stats['rows_invalid']:>10,} invalid  {stats['rows_per_second']:>10,.0f} rows/s")
+
+    try:
+        stats = import_file(args.path, restart=args.restart, column=args.column,
+                            header=not args.no_header, batch_size=args.batch_size, progress=report)
+    except (OSError, CSVImportError) as e:
+        sys.exit(f"Import failed: {e}")
+
+    if stats['completed'] and not stats['seconds']:
+        print(f"{args.path} was already imported - use --restart to import it again")
+    else:
+        print(f"Done: {stats['rows_imported']:,} imported, {stats['rows_invalid']:,} invalid "
+              f"in {stats['seconds']:.1f}s ({stats['rows_per_second']:,.0f} rows/s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,257 @@
+"""Background jobs for heavy Admin Panel work
+
+Exports and the full domain report run on a small thread pool instead of
+inside the Streamlit script, so the admin's session stays responsive
+while the page polls each job's progress. Threads rather than processes:
+the work is SQLite reads and file writes, which release the GIL, and
+jobs share the app's connection pool and profiler.
+
+Finished artifacts are written to JOB_DIR, named after the job kind, its
+parameters and the email write generation (bumped by triggers on every
+write to user_emails and download_events). Submitting the same job again before
+anything is written is served straight from disk; once the generation
+moves on, a new run replaces the old artifact. Exports are plaintext
+email lists, so JOB_DIR is kept owner-only - one created by another user
+is refused - and anything older than JOB_MAX_AGE is deleted.
+"""
+import csv
+import hashlib
+import json
+import logging
+import os
+import shutil
+import stat
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from database import get_connection
+from emails import DOWNLOAD_COUNT_SQL, get_email_generation, get_email_stats
+from export import export_emails
+
+logger = logging.getLogger(__name__)
+
+# Defaults - the app passes DIV_AI_JOB_WORKERS/_DIR/_MAX_AGE in from load_config()
+JOB_WORKERS = 2
+JOB_DIR = os.path.join(tempfile.gettempdir(), 'div_ai_jobs')
+
+# Artifacts older than this many seconds are deleted
+JOB_MAX_AGE = 24 * 3600.0
+
+# Jobs kept in memory for the status list; artifacts stay on disk
+JOB_HISTORY = 50
+
+# Domains read per fetchmany() call in the domain report
+DOMAIN_CHUNK = 1000
+
+DOMAIN_REPORT_COLUMNS = ['Domain', 'Signups', 'Downloads', 'First Signup', 'Last Signup']
+
+
+class Job:
+    """One submitted job - status, progress and, once done, its artifact"""
+
+    def __init__(self, kind, params, label):
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.params = params
+        self.label = label
+        self.status = 'queued'   # queued -> running -> done / failed
+        self.progress = 0.0
+        self.message = "Waiting for a worker"
+        self.generation = None
+        self.path = None
+        self.file_name = None
+        self.mime = None
+        self.cached = False
+        self.error = None
+        self.submitted = time.time()
+        self.finished = None
+
+    @property
+    def active(self):
+        return self.status in ('queued', 'running')
+
+    def report(self, progress, message):
+        self.progress = min(max(progress, 0.0), 1.0)
+        self.message = message
+
+
+def run_export(params, path, report):
+    """Export job - every row of user_emails in the chosen format"""
+    total = max(get_email_stats()[0], 1)
+    export_file, file_name, mime = export_emails(
+        params['format'], params['compress'],
+        progress=lambda rows: report(rows / total, f"Exported {rows:,} of {total:,} rows"),
+    )
+    with export_file, open(path, 'wb') as out:
+        shutil.copyfileobj(export_file, out)
+    return file_name, mime
+
+
+def run_domain_report(params, path, report):
+    """Domain report job - signups, downloads and first/last signup for every domain"""
+    with get_connection() as conn:
+        total = max(conn.execute('SELECT COUNT(DISTINCT domain) FROM user_emails').fetchone()[0], 1)
+        cursor = conn.execute(f'''
+            SELECT domain, COUNT(*), SUM({DOWNLOAD_COUNT_SQL}), MIN(timestamp), MAX(timestamp)
+            FROM user_emails GROUP BY domain ORDER BY COUNT(*) DESC, domain
+        ''')
+        with open(path, 'w', newline='', encoding='utf-8') as out:
+            writer = csv.writer(out)
+            writer.writerow(DOMAIN_REPORT_COLUMNS)
+            done = 0
+            while True:
+                rows = cursor.fetchmany(DOMAIN_CHUNK)
+                if not rows:
+                    break
+                writer.writerows(rows)
+                done += len(rows)
+                report(done / total, f"Counted {done:,} of {total:,} domains")
+    return f"div_ai_domains_{time.strftime('%Y%m%d_%H%M%S')}.csv", 'text/csv'
+
+
+# kind -> function(params, artifact path, report) returning (file_name, mime)
+JOB_KINDS = {
+    'export': run_export,
+    'domains': run_domain_report,
+}
+
+
+class JobRunner:
+    """Thread pool running admin jobs, with finished artifacts cached on disk"""
+
+    def __init__(self, workers=JOB_WORKERS, job_dir=JOB_DIR, max_age=JOB_MAX_AGE):
+        self.job_dir = job_dir
+        self.max_age = max_age
+        self._pool = ThreadPoolExecutor(workers, thread_name_prefix='admin-job')
+        self._jobs = OrderedDict()   # id -> Job, oldest first
+        self._lock = threading.Lock()
+
+    def _ensure_dir(self):
+        """Create job_dir owner-only, refusing one another user created first"""
+        os.makedirs(self.job_dir, mode=0o700, exist_ok=True)
+        info = os.lstat(self.job_dir)
+        if not stat.S_ISDIR(info.st_mode):
+            raise PermissionError(f"Job directory {self.job_dir} is not a directory")
+        if hasattr(os, 'getuid'):
+            if info.st_uid != os.getuid():
+                raise PermissionError(f"Job directory {self.job_dir} belongs to another user - "
+                                      "set DIV_AI_JOB_DIR to a private directory")
+            if stat.S_IMODE(info.st_mode) & 0o077:
+                os.chmod(self.job_dir, 0o700)
+
+    def prune(self):
+        """Delete artifacts (and leftover temp files) older than max_age"""
+        cutoff = time.time() - self.max_age
+        try:
+            names = os.listdir(self.job_dir)
+        except OSError:
+            return
+        for name in names:
+            path = os.path.join(self.job_dir, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+            except OSError:
+                pass
+
+    def _artifact_base(self, kind, params):
+        key = hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()[:16]
+        return os.path.join(self.job_dir, f'{kind}-{key}')
+
+    def _load_cached(self, job, generation):
+        """Fill in `job` from an artifact of this generation on disk, True if there was one"""
+        path = f'{self._artifact_base(job.kind, job.params)}-{generation}'
+        try:
+            with open(f'{path}.json') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if not os.path.exists(path):
+            return False
+        job.path, job.file_name, job.mime = path, meta['file_name'], meta['mime']
+        job.generation = generation
+        job.cached = True
+        job.report(1.0, "Unchanged since the last run - served from disk")
+        job.status = 'done'
+        job.finished = time.time()
+        return True
+
+    def _store(self, job, generation, file_name, mime, tmp_path):
+        base = self._artifact_base(job.kind, job.params)
+        path = f'{base}-{generation}'
+        os.replace(tmp_path, path)
+        with open(f'{path}.json.tmp', 'w') as f:
+            json.dump({'file_name': file_name, 'mime': mime, 'generation': generation}, f)
+        os.replace(f'{path}.json.tmp', f'{path}.json')
+        # Artifacts of older generations are stale now
+        prefix = os.path.basename(base) + '-'
+        keep = {os.path.basename(path), os.path.basename(path) + '.json'}
+        for name in os.listdir(self.job_dir):
+            if name.startswith(prefix) and name not in keep and not name.endswith('.tmp'):
+                try:
+                    os.remove(os.path.join(self.job_dir, name))
+                except OSError:
+                    pass
+        job.path, job.file_name, job.mime = path, file_name, mime
+
+    def _run(self, job):
+        job.status = 'running'
+        job.report(0.0, "Starting")
+        tmp_path = None
+        try:
+            # Read the generation before the data, so writes made while the job
+            # runs leave the artifact looking stale rather than current
+            generation = get_email_generation()
+            self._ensure_dir()
+            if self._load_cached(job, generation):
+                return
+            tmp_path = os.path.join(self.job_dir, f'{job.id}.tmp')
+            file_name, mime = JOB_KINDS[job.kind](job.params, tmp_path, job.report)
+            self._store(job, generation, file_name, mime, tmp_path)
+            tmp_path = None
+            job.generation = generation
+            job.report(1.0, "Done")
+            job.status = 'done'
+        except Exception as e:
+            logger.exception("Admin job %s (%s) failed", job.id, job.kind)
+            job.error = str(e)
+            job.status = 'failed'
+        finally:
+            job.finished = job.finished or time.time()
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def submit(self, kind, params, label):
+        """Queue a job, or return the matching one already queued or running"""
+        if kind not in JOB_KINDS:
+            raise ValueError(f"Unknown job kind: {kind}")
+        # Before anything in it is read, deleted or served
+        self._ensure_dir()
+        with self._lock:
+            for job in self._jobs.values():
+                if job.active and job.kind == kind and job.params == params:
+                    return job
+            job = Job(kind, params, label)
+            self._jobs[job.id] = job
+            # Forget the oldest finished jobs beyond the history limit
+            finished = [old.id for old in self._jobs.values() if not old.active]
+            for old_id in finished[:max(len(self._jobs) - JOB_HISTORY, 0)]:
+                del self._jobs[old_id]
+        self.prune()
+        if not self._load_cached(job, get_email_generation()):
+            self._pool.submit(self._run, job)
+        return job
+
+    def get(self, job_id):
+        return self._jobs.get(job_id)
+
+    def is_current(self, job):
+        """True if no email or download has been written since the job's data was read"""
+        return job.status == 'done' and job.generation == get_email_generation()
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,43 @@
+"""Deferred imports for heavy optional libraries
+
+pandas and pyarrow together take longer to import than the rest of the
+site. Most visitors only ever see the static pages, so modules import
+them through lazy_import() and the real import happens the first time
+an attribute is used (the Comparison table, the Admin Panel, exports).
+
+The proxy deliberately does not register itself in sys.modules -
+streamlit checks sys.modules to decide whether to look for DataFrames,
+so a half-loaded entry there would pull pandas in anyway.
+"""
+import importlib
+import importlib.util
+
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access"""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self):
+        state = 'loaded' if self._module is not None else 'not loaded'
+        return f"<lazy module '{self._name}' ({state})>"
+
+
+def lazy_import(name):
+    """Return a LazyModule for `name` without importing it"""
+    return LazyModule(name)
+
+
+def is_available(name):
+    """Check whether a module is installed without importing it"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
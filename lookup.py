@@ -0,0 +1,149 @@
+"""Cached email lookups for the Admin Panel's "Check Email" tool
+
+Results, including "not found", are kept in a bounded LRU with a TTL.
+record_downloads() and the bulk importer invalidate the addresses they
+write, so within this process a lookup never shows stale data; other
+server processes sharing the database are only bounded by the TTL.
+
+lookup_emails() checks a whole list at once: cached answers are served
+from memory and the rest are resolved with one IN (...) query, or a join
+against a temp table for lists too long for one statement's parameters.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from database import get_connection
+from emails import DOWNLOAD_COUNT_SQL
+
+# Defaults - bootstrap() applies DIV_AI_LOOKUP_CACHE_SIZE/_TTL via configure_lookup_cache()
+LOOKUP_CACHE_SIZE = 10000
+LOOKUP_TTL = 300.0
+
+# Above this many addresses, stage them in a temp table instead of binding
+# them all into one IN (...) - older SQLite builds cap a statement at 999
+IN_QUERY_LIMIT = 500
+
+# Download count includes events not yet folded in by compaction
+LOOKUP_COLUMNS = f'''
+    SELECT email, id, timestamp, {DOWNLOAD_COUNT_SQL},
+        (SELECT MAX(ts) FROM download_events WHERE email_id = user_emails.id)
+    FROM user_emails
+'''
+
+
+class EmailLookupCache:
+    """Thread-safe LRU of email -> result row (None when not found) with a TTL"""
+
+    def __init__(self, maxsize=LOOKUP_CACHE_SIZE, ttl=LOOKUP_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()   # email -> (expires, row or None)
+        self._lock = threading.Lock()
+        self.generation = 0   # bumped by every invalidation
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, email):
+        """Return (found_in_cache, row)"""
+        with self._lock:
+            entry = self._entries.get(email)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[email]
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(email)
+            self.hits += 1
+            return True, entry[1]
+
+    def put(self, email, row, generation=None):
+        """Cache a row - skipped if anything was invalidated since `generation`
+
+        Stops a lookup that raced with a write from caching what it read
+        before the write committed.
+        """
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[email] = (time.monotonic() + self.ttl, row)
+            self._entries.move_to_end(email)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, emails):
+        with self._lock:
+            self.generation += 1
+            for email in emails:
+                self._entries.pop(email, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_cache = EmailLookupCache()
+
+
+def get_lookup_cache():
+    """Return the process-wide lookup cache"""
+    return _cache
+
+
+def configure_lookup_cache(maxsize=LOOKUP_CACHE_SIZE, ttl=LOOKUP_TTL):
+    """Resize the process-wide cache and set its TTL - called from bootstrap()"""
+    _cache.maxsize = maxsize
+    _cache.ttl = ttl
+    _cache.clear()
+
+
+def invalidate_emails(emails):
+    """Drop cached results for addresses that were just written"""
+    _cache.invalidate(emails)
+
+
+def _fetch(conn, emails):
+    """{email: (id, timestamp, download_count, last_download)} for the ones that exist"""
+    if len(emails) <= IN_QUERY_LIMIT:
+        placeholders = ', '.join('?' * len(emails))
+        rows = conn.execute(f'{LOOKUP_COLUMNS} WHERE email IN ({placeholders})', emails).fetchall()
+    else:
+        conn.execute('CREATE TEMP TABLE IF NOT EXISTS lookup_batch (email TEXT PRIMARY KEY)')
+        conn.execute('DELETE FROM lookup_batch')
+        conn.executemany('INSERT OR IGNORE INTO lookup_batch (email) VALUES (?)', ((e,) for e in emails))
+        rows = conn.execute(f'{LOOKUP_COLUMNS} WHERE email IN (SELECT email FROM lookup_batch)').fetchall()
+        conn.execute('DELETE FROM lookup_batch')
+    return {row[0]: row[1:] for row in rows}
+
+
+def lookup_emails(emails):
+    """Return {email: row or None} for every address, lowercased and stripped
+
+    A row is (id, timestamp, download_count, last_download). Misses are
+    resolved together in one query and cached, not-found ones included.
+    """
+    results = {}
+    missing = []
+    for email in dict.fromkeys(e.strip().lower() for e in emails if e.strip()):
+        cached, row = _cache.get(email)
+        if cached:
+            results[email] = row
+        else:
+            missing.append(email)
+
+    if missing:
+        generation = _cache.generation
+        with get_connection() as conn:
+            found = _fetch(conn, missing)
+        for email in missing:
+            results[email] = found.get(email)
+            _cache.put(email, results[email], generation)
+    return results
+
+
+def lookup_email(email):
+    """Single-address form of lookup_emails(), returns the row or None"""
+    return lookup_emails([email]).get(email.strip().lower())
@@ -0,0 +1,195 @@
+"""Chunked SHA-256 manifest for the distributed package
+
+Every file is split into fixed-size chunks which are hashed in parallel
+by a process pool, each worker memory-mapping just its own chunk. The
+manifest lists every chunk's SHA-256 plus a Merkle root per file and one
+over all files, so a corrupt or truncated download can be pinpointed to
+the chunks that differ and re-fetched with HTTP Range requests instead
+of downloading 1.65GB again.
+
+Merkle trees use RFC 6962 style domain separation: leaves are
+sha256(0x00 || chunk) and inner nodes sha256(0x01 || left || right), an
+odd node at the end of a level is carried up unchanged. Chunk hashes are
+cached in a JSON file keyed on path, size and mtime, so re-running after
+a release only hashes what changed.
+
+    python manifest.py DIV-AI-v1.0.zip --output DIV-AI-v1.0.manifest.json
+    python manifest.py --verify DIV-AI-v1.0.manifest.json DIV-AI-v1.0.zip
+"""
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+MANIFEST_VERSION = 1
+
+# 4MB - a multiple of every platform's mmap allocation granularity
+CHUNK_SIZE = 4 * 1024 * 1024
+
+CACHE_PATH = os.getenv('DIV_AI_MANIFEST_CACHE', '.manifest_cache.json')
+
+
+def hash_chunk(path, offset, length):
+    """SHA-256 leaf hash of one chunk, read through mmap"""
+    digest = hashlib.sha256(b'\x00')
+    if length:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), length, offset=offset, access=mmap.ACCESS_READ) as mapped:
+            digest.update(mapped)
+    return digest.hexdigest()
+
+
+def _hash_chunk_args(args):
+    return hash_chunk(*args)
+
+
+def merkle_root(leaves):
+    """Root over hex leaf hashes - sha256(0x01 || left || right) per inner node"""
+    level = [bytes.fromhex(leaf) for leaf in leaves] or [hashlib.sha256(b'\x00').digest()]
+    while len(level) > 1:
+        paired = [hashlib.sha256(b'\x01' + level[i] + level[i + 1]).digest()
+                  for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0].hex()
+
+
+def chunk_ranges(size, chunk_size=CHUNK_SIZE):
+    """(offset, length) for every chunk of a file, one empty chunk for an empty file"""
+    return [(offset, min(chunk_size, size - offset)) for offset in range(0, size, chunk_size)] or [(0, 0)]
+
+
+def _load_cache(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(path, cache):
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(cache, f)
+    os.replace(tmp_path, path)
+
+
+def hash_files(paths, chunk_size=CHUNK_SIZE, workers=None, cache_path=CACHE_PATH):
+    """{path: [chunk hashes]} for every file, reusing cached hashes of unchanged files"""
+    cache = _load_cache(cache_path) if cache_path else {}
+    results, jobs = {}, []
+    for path in paths:
+        stat = os.stat(path)
+        key = os.path.abspath(path)
+        cached = cache.get(key)
+        if cached and cached['size'] == stat.st_size and cached['mtime_ns'] == stat.st_mtime_ns \
+                and cached['chunk_size'] == chunk_size:
+            results[path] = cached['chunks']
+            continue
+        ranges = chunk_ranges(stat.st_size, chunk_size)
+        jobs.append((path, key, stat, len(ranges)))
+        results[path] = [(path, offset, length) for offset, length in ranges]
+
+    if jobs:
+        tasks = [task for path, _, _, _ in jobs for task in results[path]]
+        with ProcessPoolExecutor(workers) as pool:
+            hashes = iter(pool.map(_hash_chunk_args, tasks, chunksize=4))
+            for path, key, stat, count in jobs:
+                results[path] = [next(hashes) for _ in range(count)]
+                cache[key] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                              'chunk_size': chunk_size, 'chunks': results[path]}
+        if cache_path:
+            _save_cache(cache_path, cache)
+    return results
+
+
+def build_manifest(paths, chunk_size=CHUNK_SIZE, workers=None, cache_path=CACHE_PATH):
+    """Manifest dict for `paths`, names relative to their common directory"""
+    hashes = hash_files(paths, chunk_size, workers, cache_path)
+    base = os.path.commonpath([os.path.dirname(os.path.abspath(p)) for p in paths])
+    files = []
+    for path in paths:
+        files.append({
+            'name': os.path.relpath(os.path.abspath(path), base).replace(os.sep, '/'),
+            'size': os.path.getsize(path),
+            'merkle_root': merkle_root(hashes[path]),
+            'chunks': hashes[path],
+        })
+    return {
+        'version': MANIFEST_VERSION,
+        'algorithm': 'sha256',
+        'chunk_size': chunk_size,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'root': merkle_root([entry['merkle_root'] for entry in files]),
+        'files': files,
+    }
+
+
+def verify_file(entry, path, chunk_size, workers=None):
+    """[(chunk index, offset, length)] of manifest chunks the local file doesn't match"""
+    actual = hash_files([path], chunk_size, workers, cache_path=None)[path]
+    bad = []
+    for index, expected in enumerate(entry['chunks']):
+        if index >= len(actual) or actual[index] != expected:
+            offset = index * chunk_size
+            bad.append((index, offset, min(chunk_size, entry['size'] - offset)))
+    return bad
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('paths', nargs='+', help='files to hash, or the manifest then files with --verify')
+    parser.add_argument('--output', help='write the manifest here (default: stdout)')
+    parser.add_argument('--verify', action='store_true', help='check files against a manifest')
+    parser.add_argument('--chunk-size-mb', type=int, default=CHUNK_SIZE // 1024 // 1024)
+    parser.add_argument('--workers', type=int, default=None, help='hashing processes (default: CPU count)')
+    parser.add_argument('--cache', default=CACHE_PATH, help="chunk hash cache file, '' to disable")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.verify:
+        with open(args.paths[0]) as f:
+            manifest = json.load(f)
+        entries = {entry['name'].rsplit('/', 1)[-1]: entry for entry in manifest['files']}
+        failed = False
+        for path in args.paths[1:]:
+            entry = entries.get(os.path.basename(path))
+            if entry is None:
+                print(f"{path}: not in manifest")
+                failed = True
+                continue
+            bad = verify_file(entry, path, manifest['chunk_size'], args.workers)
+            size = os.path.getsize(path)
+            if size > entry['size']:
+                print(f"{path}: {size - entry['size']} bytes longer than expected - truncate to {entry['size']}")
+                failed = True
+            if not bad:
+                if size == entry['size']:
+                    print(f"{path}: OK")
+                continue
+            failed = True
+            print(f"{path}: {len(bad)} of {len(entry['chunks'])} chunks differ - re-fetch these byte ranges:")
+            for index, offset, length in bad:
+                print(f"  chunk {index}: bytes={offset}-{offset + length - 1}")
+        sys.exit(1 if failed else 0)
+
+    manifest = build_manifest(args.paths, args.chunk_size_mb * 1024 * 1024, args.workers, args.cache or None)
+    text = json.dumps(manifest, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text)
+        total = sum(entry['size'] for entry in manifest['files'])
+        elapsed = time.perf_counter() - start
+        print(f"{len(manifest['files'])} files, {total / 1024 / 1024:,.0f} MB in {elapsed:.1f}s "
+              f"({total / 1024 / 1024 / elapsed:,.0f} MB/s), root {manifest['root']}")
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
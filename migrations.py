@@ -0,0 +1,353 @@
+"""Versioned schema migrations for div_ai_emails.db
+
+The schema version lives in PRAGMA user_version. Each migration runs in
+its own transaction and bumps the version, so startup only has to read
+one pragma once the database is current. Add new migrations to the end
+of MIGRATIONS - never edit or reorder ones that have shipped.
+
+Migrations 1-3 are written to also cope with databases created before
+versioning existed (user_version 0 but some tables already present).
+"""
+from emails import domain_sql, normalized_email_sql
+
+
+def _columns(conn, table):
+    return [row[1] for row in conn.execute(f'PRAGMA table_info({table})')]
+
+
+def create_user_emails(conn):
+    """Original email table"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS user_emails (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            email TEXT UNIQUE NOT NULL,
+            timestamp TEXT NOT NULL,
+            download_count INTEGER DEFAULT 1
+        )
+    ''')
+
+
+def add_stats_tables(conn):
+    """Running totals kept current by triggers so the admin metrics are O(1)"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS stats (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            total_emails INTEGER NOT NULL DEFAULT 0,
+            total_downloads INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS daily_stats (
+            day TEXT PRIMARY KEY,
+            new_emails INTEGER NOT NULL DEFAULT 0,
+            downloads INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS user_emails_stats_insert
+        AFTER INSERT ON user_emails
+        BEGIN
+            UPDATE stats SET total_emails = total_emails + 1,
+                             total_downloads = total_downloads + NEW.download_count
+            WHERE id = 1;
+            INSERT INTO daily_stats (day, new_emails, downloads)
+            VALUES (substr(NEW.timestamp, 1, 10), 1, NEW.download_count)
+            ON CONFLICT(day) DO UPDATE SET new_emails = new_emails + 1,
+                                           downloads = downloads + excluded.downloads;
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS user_emails_stats_update
+        AFTER UPDATE OF download_count ON user_emails
+        BEGIN
+            UPDATE stats SET total_downloads = total_downloads + NEW.download_count - OLD.download_count
+            WHERE id = 1;
+            INSERT INTO daily_stats (day, downloads)
+            VALUES (date('now', 'localtime'), NEW.download_count - OLD.download_count)
+            ON CONFLICT(day) DO UPDATE SET downloads = downloads + excluded.downloads;
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS user_emails_stats_delete
+        AFTER DELETE ON user_emails
+        BEGIN
+            UPDATE stats SET total_emails = total_emails - 1,
+                             total_downloads = total_downloads - OLD.download_count
+            WHERE id = 1;
+        END
+    ''')
+
+    # Backfill the totals from whatever is already in the table
+    cursor = conn.execute('''
+        INSERT OR IGNORE INTO stats (id, total_emails, total_downloads)
+        SELECT 1, COUNT(*), COALESCE(SUM(download_count), 0) FROM user_emails
+    ''')
+    if cursor.rowcount:
+        conn.execute('''
+            INSERT OR REPLACE INTO daily_stats (day, new_emails, downloads)
+            SELECT substr(timestamp, 1, 10), COUNT(*), SUM(download_count)
+            FROM user_emails GROUP BY substr(timestamp, 1, 10)
+        ''')
+
+
+def add_domain_column(conn):
+    """Stored email domain for SQL-side analytics"""
+    if 'domain' not in _columns(conn, 'user_emails'):
+        conn.execute('ALTER TABLE user_emails ADD COLUMN domain TEXT')
+    conn.execute(f"UPDATE user_emails SET domain = {domain_sql('email')} WHERE domain IS NULL")
+
+
+def add_indexes(conn):
+    """Indexes for the admin listing, domain analytics and duplicate lookups"""
+    conn.execute('ALTER TABLE user_emails ADD COLUMN email_normalized TEXT')
+    conn.execute(f"UPDATE user_emails SET email_normalized = {normalized_email_sql('email')}")
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_user_emails_timestamp ON user_emails (timestamp, id)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_user_emails_domain ON user_emails (domain, timestamp)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_user_emails_normalized ON user_emails (email_normalized)')
+
+
+def add_import_progress(conn):
+    """Checkpoints for resumable bulk imports (import_emails.py)"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS import_progress (
+            source TEXT PRIMARY KEY,
+            file_size INTEGER NOT NULL,
+            file_mtime REAL NOT NULL,
+            byte_offset INTEGER NOT NULL DEFAULT 0,
+            rows_read INTEGER NOT NULL DEFAULT 0,
+            rows_imported INTEGER NOT NULL DEFAULT 0,
+            rows_invalid INTEGER NOT NULL DEFAULT 0,
+            completed INTEGER NOT NULL DEFAULT 0,
+            updated TEXT NOT NULL
+        )
+    ''')
+
+
+def add_hourly_stats(conn):
+    """Hourly rollup next to daily_stats for the admin time-series charts"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS hourly_stats (
+            hour TEXT PRIMARY KEY,
+            new_emails INTEGER NOT NULL DEFAULT 0,
+            downloads INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    # Separate triggers so the shipped daily ones stay untouched; hours are
+    # keyed 'YYYY-MM-DDTHH', the first 13 characters of an isoformat timestamp
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS user_emails_hourly_insert
+        AFTER INSERT ON user_emails
+        BEGIN
+            INSERT INTO hourly_stats (hour, new_emails, downloads)
+            VALUES (substr(NEW.timestamp, 1, 13), 1, NEW.download_count)
+            ON CONFLICT(hour) DO UPDATE SET new_emails = new_emails + 1,
+                                            downloads = downloads + excluded.downloads;
+        END
+    ''')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS user_emails_hourly_update
+        AFTER UPDATE OF download_count ON user_emails
+        BEGIN
+            INSERT INTO hourly_stats (hour, downloads)
+            VALUES (strftime('%Y-%m-%dT%H', 'now', 'localtime'), NEW.download_count - OLD.download_count)
+            ON CONFLICT(hour) DO UPDATE SET downloads = downloads + excluded.downloads;
+        END
+    ''')
+
+    # Backfill like daily_stats was: repeat downloads before this point only
+    # have the signup time, so they are counted in the signup hour
+    conn.execute('''
+        INSERT OR REPLACE INTO hourly_stats (hour, new_emails, downloads)
+        SELECT substr(timestamp, 1, 13), COUNT(*), SUM(download_count)
+        FROM user_emails GROUP BY substr(timestamp, 1, 13)
+    ''')
+
+
+def add_download_events(conn):
+    """Append-only download log; download_count becomes a compacted cache of it"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS download_events (
+            id INTEGER PRIMARY KEY,
+            email_id INTEGER NOT NULL REFERENCES user_emails (id),
+            ts TEXT NOT NULL,
+            ua_hash TEXT
+        )
+    ''')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_download_events_ts ON download_events (ts)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_download_events_email ON download_events (email_id, ts)')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS event_compaction (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            last_event_id INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    conn.execute('INSERT OR IGNORE INTO event_compaction (id, last_event_id) VALUES (1, 0)')
+
+    # Downloads are credited to the rollups when the event is logged, at the
+    # event's own time. Compaction then only moves the per-email counter, so
+    # the download_count update triggers would count everything twice.
+    conn.execute('DROP TRIGGER IF EXISTS user_emails_stats_update')
+    conn.execute('DROP TRIGGER IF EXISTS user_emails_hourly_update')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS download_events_stats
+        AFTER INSERT ON download_events
+        BEGIN
+            UPDATE stats SET total_downloads = total_downloads + 1 WHERE id = 1;
+            INSERT INTO daily_stats (day, downloads) VALUES (substr(NEW.ts, 1, 10), 1)
+            ON CONFLICT(day) DO UPDATE SET downloads = downloads + 1;
+            INSERT INTO hourly_stats (hour, downloads) VALUES (substr(NEW.ts, 1, 13), 1)
+            ON CONFLICT(hour) DO UPDATE SET downloads = downloads + 1;
+        END
+    ''')
+
+
+def add_email_generation(conn):
+    """Counter bumped by every write to user_emails, for caching derived artifacts"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS email_generation (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            generation INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    conn.execute('INSERT OR IGNORE INTO email_generation (id, generation) VALUES (1, 0)')
+    for event in ('INSERT', 'UPDATE', 'DELETE'):
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS user_emails_generation_{event.lower()}
+            AFTER {event} ON user_emails
+            BEGIN
+                UPDATE email_generation SET generation = generation + 1 WHERE id = 1;
+            END
+        ''')
+
+
+def _download_events_triggers(conn):
+    """Indexes and stats triggers of download_events, recreated after a rebuild"""
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_download_events_ts ON download_events (ts)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_download_events_email ON download_events (email_id, ts)')
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS download_events_stats
+        AFTER INSERT ON download_events
+        BEGIN
+            UPDATE stats SET total_downloads = total_downloads + 1 WHERE id = 1;
+            INSERT INTO daily_stats (day, downloads) VALUES (substr(NEW.ts, 1, 10), 1)
+            ON CONFLICT(day) DO UPDATE SET downloads = downloads + 1;
+            INSERT INTO hourly_stats (hour, downloads) VALUES (substr(NEW.ts, 1, 13), 1)
+            ON CONFLICT(hour) DO UPDATE SET downloads = downloads + 1;
+        END
+    ''')
+    # user_emails_stats_delete subtracts OLD.download_count, which only covers
+    # compacted events - the rest come off here as the cascade removes them
+    conn.execute('''
+        CREATE TRIGGER IF NOT EXISTS download_events_stats_delete
+        AFTER DELETE ON download_events
+        WHEN OLD.id > (SELECT last_event_id FROM event_compaction WHERE id = 1)
+        BEGIN
+            UPDATE stats SET total_downloads = total_downloads - 1 WHERE id = 1;
+        END
+    ''')
+
+
+def cascade_download_events(conn):
+    """Let deleting an email delete its download events, and take them off the totals"""
+    # SQLite can't alter a foreign key, so rebuild the table with ON DELETE CASCADE
+    conn.execute('''
+        CREATE TABLE download_events_new (
+            id INTEGER PRIMARY KEY,
+            email_id INTEGER NOT NULL REFERENCES user_emails (id) ON DELETE CASCADE,
+            ts TEXT NOT NULL,
+            ua_hash TEXT
+        )
+    ''')
+    conn.execute('INSERT INTO download_events_new (id, email_id, ts, ua_hash) '
+                 'SELECT id, email_id, ts, ua_hash FROM download_events')
+    conn.execute('DROP TABLE download_events')
+    conn.execute('ALTER TABLE download_events_new RENAME TO download_events')
+    _download_events_triggers(conn)
+
+
+def autoincrement_download_events(conn):
+    """Never reuse download event ids, so new events always land above the compaction mark"""
+    # Without AUTOINCREMENT, deleting the newest events lets SQLite hand their
+    # ids out again - at or below last_event_id, where compaction never looks
+    conn.execute('''
+        CREATE TABLE download_events_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            email_id INTEGER NOT NULL REFERENCES user_emails (id) ON DELETE CASCADE,
+            ts TEXT NOT NULL,
+            ua_hash TEXT
+        )
+    ''')
+    conn.execute('INSERT INTO download_events_new (id, email_id, ts, ua_hash) '
+                 'SELECT id, email_id, ts, ua_hash FROM download_events')
+    conn.execute('DROP TABLE download_events')
+    conn.execute('ALTER TABLE download_events_new RENAME TO download_events')
+    # Ids already compacted may have been deleted since, start above them too
+    conn.execute("DELETE FROM sqlite_sequence WHERE name = 'download_events'")
+    conn.execute('''
+        INSERT INTO sqlite_sequence (name, seq)
+        SELECT 'download_events', MAX(
+            (SELECT COALESCE(MAX(id), 0) FROM download_events),
+            (SELECT last_event_id FROM event_compaction WHERE id = 1))
+    ''')
+    _download_events_triggers(conn)
+
+
+def add_download_event_generation(conn):
+    """Bump the email generation on download_events writes too"""
+    # Listings, exports and the domain report count uncompacted events, so a
+    # repeat download changes them without touching user_emails
+    for event in ('INSERT', 'DELETE'):
+        conn.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS download_events_generation_{event.lower()}
+            AFTER {event} ON download_events
+            BEGIN
+                UPDATE email_generation SET generation = generation + 1 WHERE id = 1;
+            END
+        ''')
+
+
+# (version, migration) - the version is what user_version becomes afterwards
+MIGRATIONS = [
+    (1, create_user_emails),
+    (2, add_stats_tables),
+    (3, add_domain_column),
+    (4, add_indexes),
+    (5, add_import_progress),
+    (6, add_hourly_stats),
+    (7, add_download_events),
+    (8, add_email_generation),
+    (9, cascade_download_events),
+    (10, autoincrement_download_events),
+    (11, add_download_event_generation),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn):
+    return conn.execute('PRAGMA user_version').fetchone()[0]
+
+
+def run_migrations(conn):
+    """Apply every migration newer than the database, returns versions applied"""
+    applied = []
+    if get_schema_version(conn) >= SCHEMA_VERSION:
+        return applied
+
+    for version, migration in MIGRATIONS:
+        # Take the write lock before re-checking so two processes starting
+        # at the same time don't both apply the same migration
+        conn.commit()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            if get_schema_version(conn) >= version:
+                conn.rollback()
+                continue
+            migration(conn)
+            conn.execute(f'PRAGMA user_version = {version}')
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        applied.append(version)
+    return applied
@@ -0,0 +1,77 @@
+"""Process and host resource sampling for the Admin Panel
+
+A daemon thread takes one psutil sample every `interval` seconds into a
+ring buffer, so the admin can see memory growth, CPU and file descriptor
+use and the SQLite file/WAL sizes over the last hour without attaching
+external tooling. psutil is imported on first use only - the thread is
+started the first time the Admin Panel shows the widget, not at startup.
+"""
+import logging
+import os
+import threading
+from collections import deque
+from datetime import datetime
+
+import database
+from lazy_imports import lazy_import
+
+psutil = lazy_import('psutil')
+
+logger = logging.getLogger(__name__)
+
+# Defaults - the app passes DIV_AI_MONITOR_INTERVAL/_SAMPLES in from load_config()
+MONITOR_INTERVAL = 5.0
+MONITOR_SAMPLES = 720   # an hour at 5s
+
+SAMPLE_FIELDS = ['time', 'process_cpu', 'host_cpu', 'rss_mb', 'host_memory', 'open_files',
+                 'threads', 'db_mb', 'wal_mb']
+
+
+def _file_mb(path):
+    try:
+        return os.path.getsize(path) / 1024 / 1024
+    except OSError:
+        return 0.0
+
+
+class ResourceMonitor:
+    """Sample this process and the host into a bounded deque"""
+
+    def __init__(self, interval=MONITOR_INTERVAL, size=MONITOR_SAMPLES):
+        self.interval = interval
+        self.samples = deque(maxlen=size)
+        self._process = psutil.Process()
+        # cpu_percent() measures since the previous call, prime both counters
+        self._process.cpu_percent()
+        psutil.cpu_percent()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='resource-monitor', daemon=True)
+        self._thread.start()
+
+    def sample(self):
+        """Take one sample now and append it to the buffer"""
+        process = self._process
+        with process.oneshot():
+            rss = process.memory_info().rss
+            cpu = process.cpu_percent()
+            threads = process.num_threads()
+            open_files = process.num_fds() if hasattr(process, 'num_fds') else process.num_handles()
+        db_path = database.DB_PATH
+        row = (datetime.now(), cpu, psutil.cpu_percent(), rss / 1024 / 1024,
+               psutil.virtual_memory().percent, open_files, threads,
+               _file_mb(db_path), _file_mb(f'{db_path}-wal'))
+        self.samples.append(row)
+        return row
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            try:
+                self.sample()
+            except Exception:
+                # A psutil hiccup shouldn't kill the thread
+                logger.exception("Resource sample failed")
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join()
+
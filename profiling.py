@@ -0,0 +1,184 @@
+"""Lightweight timers for the hot paths of the site
+
+    with timer('init_database'):
+        ...
+
+    @timed('save_email')
+    def save_email(email):
+        ...
+
+Every timer name gets a fixed-bucket histogram, shared by all sessions in
+the process, so recording a sample is one perf_counter() pair and a few
+integer updates. The Admin Panel shows the histograms in its collapsed
+"Performance timings" section. When DIV_AI_METRICS_FILE is set, the
+histograms are also written to that file in the Prometheus text format
+(for node_exporter's textfile collector or a plain HTTP file server),
+at most every METRICS_WRITE_SECONDS.
+"""
+import bisect
+import functools
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Histogram bucket upper bounds in seconds, Prometheus style (cumulative on export)
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+METRICS_WRITE_SECONDS = 15
+
+logger = logging.getLogger(__name__)
+
+
+class Histogram:
+    """Count, sum, min/max and fixed bucket counts for one timer"""
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)   # last slot is +Inf
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-th sample (max for +Inf)"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, bucket_count in zip(BUCKETS, self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+class Profiler:
+    """Named histograms shared by every session in the process"""
+
+    def __init__(self, enabled=True, metrics_file=None):
+        self.enabled = enabled
+        self.metrics_file = metrics_file
+        self._histograms = {}
+        self._lock = threading.Lock()
+        self._last_write = 0.0
+
+    def observe(self, name, seconds):
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def timer(self, name):
+        """Time the body of a with block, including when it raises"""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def snapshot(self):
+        """[(name, count, mean, p50, p95, p99, max)] in ms, sorted by total time"""
+        with self._lock:
+            items = sorted(self._histograms.items(), key=lambda item: item[1].total, reverse=True)
+            return [
+                (name, h.count, h.total / h.count * 1000, h.quantile(0.5) * 1000,
+                 h.quantile(0.95) * 1000, h.quantile(0.99) * 1000, h.max * 1000)
+                for name, h in items
+            ]
+
+    def buckets(self, name):
+        """[(upper bound label, count)] for one timer, non-cumulative"""
+        with self._lock:
+            histogram = self._histograms.get(name)
+            counts = list(histogram.counts) if histogram else []
+        labels = [f'≤{bound * 1000:g}ms' for bound in BUCKETS] + ['>10s']
+        return list(zip(labels, counts))
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+
+    def to_prometheus(self):
+        """All histograms in the Prometheus text exposition format"""
+        lines = [
+            '# HELP div_ai_duration_seconds Time spent in instrumented div_ai code paths',
+            '# TYPE div_ai_duration_seconds histogram',
+        ]
+        with self._lock:
+            for name, h in sorted(self._histograms.items()):
+                label = name.replace('\\', '\\\\').replace('"', '\\"')
+                cumulative = 0
+                for bound, bucket_count in zip(BUCKETS, h.counts):
+                    cumulative += bucket_count
+                    lines.append(f'div_ai_duration_seconds_bucket{{name="{label}",le="{bound:g}"}} {cumulative}')
+                lines.append(f'div_ai_duration_seconds_bucket{{name="{label}",le="+Inf"}} {h.count}')
+                lines.append(f'div_ai_duration_seconds_sum{{name="{label}"}} {h.total:.6f}')
+                lines.append(f'div_ai_duration_seconds_count{{name="{label}"}} {h.count}')
+        return '\n'.join(lines) + '\n'
+
+    def write_metrics(self, path=None):
+        """Write to_prometheus() atomically so a scraper never sees half a file"""
+        path = path or self.metrics_file
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp_path, path)
+        self._last_write = time.monotonic()
+        return path
+
+    def maybe_write_metrics(self):
+        """write_metrics() if a file is configured and the last write is stale"""
+        if self.metrics_file and time.monotonic() - self._last_write >= METRICS_WRITE_SECONDS:
+            try:
+                self.write_metrics()
+            except OSError:
+                # Don't retry on every rerun if the path is unwritable
+                self._last_write = time.monotonic()
+                logger.exception("Could not write metrics to %s", self.metrics_file)
+
+
+_profiler = Profiler(
+    enabled=os.getenv('DIV_AI_PROFILING', '1') != '0',
+    metrics_file=os.getenv('DIV_AI_METRICS_FILE') or None,
+)
+
+
+def get_profiler():
+    """Return the process-wide profiler"""
+    return _profiler
+
+
+def configure_profiling(enabled=True, metrics_file=None):
+    """Turn timers on/off and set the metrics file - called from bootstrap()"""
+    _profiler.enabled = enabled
+    _profiler.metrics_file = metrics_file or None
+
+
+def timer(name):
+    """Context manager recording the block's duration under `name`"""
+    return _profiler.timer(name)
+
+
+def timed(name):
+    """Decorator form of timer()"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with _profiler.timer(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,87 @@
+"""In-memory rate limiting for the email capture path
+
+Every submission is checked here before any database work:
+
+- a per-client token bucket absorbs short bursts (a user double
+  clicking) but holds each client to a steady rate
+- a per-client sliding window caps how many submissions one client can
+  make in a longer window, so a slow drip can't add up either
+- a global token bucket caps total admissions across all clients, which
+  keeps a distributed flood from queueing everyone behind SQLite's
+  single writer
+
+State lives in process memory in an LRU bounded at `max_clients`, so a
+flood of random keys evicts the least recently seen clients instead of
+growing without limit.
+"""
+import threading
+import time
+from collections import OrderedDict, deque
+
+
+class TokenBucket:
+    """Classic token bucket - `rate` tokens per second, up to `capacity`"""
+
+    def __init__(self, rate, capacity, now=None):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic() if now is None else now
+
+    def refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + max(now - self.updated, 0) * self.rate)
+        self.updated = now
+
+    def allow(self, now, cost=1):
+        self.refill(now)
+        if self.tokens >= cost:
+            self.tokens -= cost
+            return True
+        return False
+
+
+class RateLimiter:
+    """Per-client token bucket + sliding window, behind a global bucket"""
+
+    def __init__(self, rate_per_minute=6, burst=3, window_seconds=3600, window_limit=30,
+                 global_rate_per_second=50, max_clients=50000):
+        self.rate = rate_per_minute / 60
+        self.burst = burst
+        self.window_seconds = window_seconds
+        self.window_limit = window_limit
+        self.max_clients = max_clients
+        self._global = TokenBucket(global_rate_per_second, global_rate_per_second)
+        self._clients = OrderedDict()   # key -> (TokenBucket, deque of admit times)
+        self._lock = threading.Lock()
+        self.rejected = 0
+
+    def allow(self, key, now=None):
+        """Return True if `key` may submit now; records the attempt if so"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry is None:
+                entry = (TokenBucket(self.rate, self.burst, now), deque())
+                self._clients[key] = entry
+                if len(self._clients) > self.max_clients:
+                    self._clients.popitem(last=False)
+            else:
+                self._clients.move_to_end(key)
+            bucket, window = entry
+
+            # Slide the window forward
+            while window and window[0] <= now - self.window_seconds:
+                window.popleft()
+
+            # Check everything before spending any tokens, so a rejection
+            # by one limit doesn't cost the client a token in another
+            bucket.refill(now)
+            self._global.refill(now)
+            if len(window) >= self.window_limit or bucket.tokens < 1 or self._global.tokens < 1:
+                self.rejected += 1
+                return False
+
+            bucket.tokens -= 1
+            self._global.tokens -= 1
+            window.append(now)
+            return True
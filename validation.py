@@ -0,0 +1,24 @@
+"""Email address validation
+
+The pattern is compiled once at import. validate_email() keeps an LRU of
+recent results for the interactive path, where the same visitor often
+resubmits the same address. validate_emails() is the bulk API for imports;
+it skips the cache so a large file doesn't churn it.
+"""
+import re
+from functools import lru_cache
+
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+
+@lru_cache(maxsize=4096)
+def validate_email(email):
+    """Validate email format"""
+    return EMAIL_PATTERN.match(email) is not None
+
+
+def validate_emails(emails):
+    """Yield (email, is_valid) for every address in an iterable"""
+    match = EMAIL_PATTERN.match
+    for email in emails:
+        yield email, match(email) is not None
@@ -0,0 +1,31 @@
+"""One module per site page, imported the first time the page is opened
+
+Each module exposes render(). div_ai.py only draws the shared chrome
+(CSS, sidebar, header, footer) and hands the selected page to
+render_page(), so a rerun executes the code for the active page only.
+"""
+import importlib
+
+from profiling import get_profiler, timer
+
+# Sidebar label -> module under views/
+PAGES = {
+    "Home": "views.home",
+    "Features": "views.features",
+    "Comparison": "views.comparison",
+    "Screenshots": "views.screenshots",
+    "Technical Specs": "views.technical_specs",
+    "Download": "views.download",
+    "FAQ": "views.faq",
+    "About Creator": "views.about_creator",
+    "Admin Panel": "views.admin_panel",
+}
+
+
+def render_page(page):
+    """Import the page's module on first use and render it, timed per page"""
+    try:
+        with timer(f'page:{page}'):
+            importlib.import_module(PAGES[page]).render()
+    finally:
+        get_profiler().maybe_write_metrics()
@@ -0,0 +1,45 @@
+import streamlit as st
+
+from views.common import get_page_content
+
+
+def render():
+    """About Creator page"""
+    content = get_page_content("About Creator")
+    st.markdown("## Meet the Creator")
+    
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        try:
+            st.image("path/to/your_photo.jpg", width=300, caption="Divyansh Pandit")
+        except:
+            st.markdown(content['photo_placeholder'], unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("### Divyansh Pandit")
+        st.markdown("**Creator & Developer of DIV-AI**")
+        st.markdown(content['bio'])
+        
+        st.markdown("### Achievements")
+        st.markdown(content['achievements'])
+    
+    st.markdown("---")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### The Story Behind DIV-AI")
+        st.markdown(content['story'])
+    
+    with col2:
+        st.markdown("### Developer Philosophy")
+        st.markdown(content['philosophy'])
+    
+    st.markdown("---")
+    
+    st.markdown("### What's Next?")
+    st.markdown(content['cards'], unsafe_allow_html=True)
+    
+    st.markdown("### Connect & Support")
+    st.markdown(content['support'])
@@ -0,0 +1,359 @@
+import os
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+from functools import partial
+
+import streamlit as st
+
+from emails import (get_email_stats, get_daily_stats, get_email_page_dataframe, get_domain_counts,
+                    get_activity_dataframe, ACTIVITY_GRANULARITIES)
+from export import available_formats
+from import_emails import CSVImportError, import_emails
+from lazy_imports import is_available, lazy_import
+from lookup import get_lookup_cache, lookup_email, lookup_emails
+from monitor import SAMPLE_FIELDS
+from profiling import get_profiler
+from views.common import get_config, get_job_runner, get_resource_monitor
+
+pd = lazy_import('pandas')
+
+# How often the job list refreshes itself while something is running
+JOB_POLL_SECONDS = 1.0
+
+# Newer Streamlit releases accept a callable download_button `data`, read on click
+try:
+    from streamlit.runtime.media_file_manager import MediaFileManager
+    DEFERRED_DOWNLOADS = hasattr(MediaFileManager, 'add_deferred')
+except ImportError:
+    DEFERRED_DOWNLOADS = False
+
+
+def submit_job(kind, params, label):
+    """Queue a background job and remember it for this admin session"""
+    try:
+        job = get_job_runner().submit(kind, params, label)
+    except Exception as e:
+        st.error(f"Could not start job: {e}")
+        return
+    job_ids = st.session_state.setdefault('admin_jobs', [])
+    if job.id not in job_ids:
+        job_ids.append(job.id)
+
+
+def read_artifact(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def render_jobs(runner, job_ids):
+    """Status, progress and downloads for this session's jobs, newest first
+
+    Returns True while any of them is still queued or running.
+    """
+    active = False
+    for job in reversed([job for job in map(runner.get, job_ids) if job]):
+        st.markdown(f"**{job.label}**")
+        if job.active:
+            active = True
+            st.progress(job.progress, text=job.message)
+        elif job.status == 'failed':
+            st.error(f"Job failed: {job.error}")
+        else:
+            if not runner.is_current(job):
+                st.caption("⚠️ Emails have changed since this ran - start it again for fresh data.")
+            try:
+                size = os.path.getsize(job.path)
+            except OSError:
+                st.caption("File removed - start the job again.")
+                continue
+            st.caption(f"{job.message} · {size / 1024:,.1f} KB")
+            # A callable is only read when the button is clicked, not on every
+            # rerun/poll; older releases are handed the open file instead
+            with (nullcontext(partial(read_artifact, job.path)) if DEFERRED_DOWNLOADS
+                  else open(job.path, 'rb')) as data:
+                st.download_button(
+                    label=f"📄 Download {job.file_name}",
+                    data=data,
+                    file_name=job.file_name,
+                    mime=job.mime,
+                    key=f"job-download-{job.id}"
+                )
+    return active
+
+
+def render():
+    """Admin Panel page - password protected email dashboard"""
+    config = get_config()
+    
+    admin_password = st.text_input("Enter Admin Password:", type="password")
+    admin_password_correct = config['admin_password']
+    
+    if admin_password_correct == 'fallback_password':
+        st.error("⚠️ Admin password not configured! Please set ADMIN_PASSWORD in your .env file.")
+        st.stop()
+
+    if admin_password == admin_password_correct:
+        st.markdown("## 🔧 Admin Dashboard")
+        
+        try:
+            total_emails, total_downloads = get_email_stats()
+            today = get_daily_stats(datetime.now().strftime('%Y-%m-%d'))
+        except Exception as e:
+            st.error(f"Database error: {e}")
+            total_emails, total_downloads, today = 0, 0, (0, 0)
+        
+        # Display statistics
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Total Emails Collected", total_emails, delta=f"{today[0]} today")
+        with col2:
+            st.metric("Total Downloads", total_downloads, delta=f"{today[1]} today")
+        with col3:
+            st.metric("Avg Downloads per User", round(total_downloads/total_emails, 2) if total_emails > 0 else 0)
+        
+        # Email verification tool
+        st.markdown("### 🔍 Email Verification Tool")
+        st.info("Enter an email address to check if it's in your database")
+        
+        test_email = st.text_input("Enter email to check:", placeholder="user@example.com")
+        if test_email and st.button("Check Email"):
+            # Check if this email exists in database (cached, misses included)
+            try:
+                result = lookup_email(test_email)
+            except Exception as e:
+                st.error(f"Database error: {e}")
+                result = None
+            
+            if result:
+                st.success(f"✅ Email '{test_email}' found in database!")
+                st.write(f"**Submission Date:** {result[1]}")
+                st.write(f"**Download Count:** {result[2]}")
+                if result[3]:
+                    st.write(f"**Last Download:** {result[3]}")
+            else:
+                st.warning(f"❌ Email '{test_email}' not found in database")
+        
+        with st.expander("Check many emails at once"):
+            bulk_emails = st.text_area("Emails to check (one per line or comma separated):", height=150)
+            if bulk_emails.strip() and st.button("Check All"):
+                try:
+                    results = lookup_emails(bulk_emails.replace(',', '\n').splitlines())
+                except Exception as e:
+                    st.error(f"Database error: {e}")
+                    results = {}
+                if results:
+                    found = sum(row is not None for row in results.values())
+                    st.write(f"**{found} of {len(results)} found**")
+                    bulk_df = pd.DataFrame(
+                        [(email, row is not None) + tuple(row[1:] if row else (None, None, None))
+                         for email, row in results.items()],
+                        columns=['Email', 'Found', 'Submission Date', 'Download Count', 'Last Download']
+                    )
+                    st.dataframe(bulk_df, use_container_width=True, hide_index=True)
+            lookup_cache = get_lookup_cache()
+            st.caption(f"Lookup cache: {len(lookup_cache)} entries, "
+                       f"{lookup_cache.hits} hits / {lookup_cache.misses} misses")
+        
+        # Bulk import from a CSV upload
+        st.markdown("### 📤 Import Emails")
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            import_upload = st.file_uploader("CSV file", type=['csv'])
+        with col2:
+            import_column = st.text_input("Email column", value="email")
+        if import_upload is not None and st.button("Import"):
+            try:
+                with st.spinner("Importing emails..."):
+                    stats = import_emails(import_upload, column=import_column)
+                st.success(f"✅ Imported {stats['rows_imported']:,} emails "
+                           f"({stats['rows_invalid']:,} invalid rows skipped, "
+                           f"{stats['rows_per_second']:,.0f} rows/s)")
+                total_emails, total_downloads = get_email_stats()
+            except (CSVImportError, UnicodeDecodeError) as e:
+                st.error(f"Import failed: {e}")
+            except Exception as e:
+                st.error(f"Database error: {e}")
+        
+        # Display all email data
+        st.markdown("### 📋 Email Database")
+        if total_emails:
+            # Search and page size controls
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                search = st.text_input("Search emails:", placeholder="Email or @domain starts with...")
+            with col2:
+                page_size = st.selectbox("Rows per page", [25, 50, 100, 250], index=1)
+            
+            # Start again from the first page whenever the filter changes
+            if st.session_state.get('email_page_filter') != (search, page_size):
+                st.session_state.email_page_filter = (search, page_size)
+                st.session_state.email_page_cursors = [None]
+            cursors = st.session_state.email_page_cursors
+            
+            try:
+                df, next_cursor = get_email_page_dataframe(page_size, cursors[-1], search)
+            except Exception as e:
+                st.error(f"Database error: {e}")
+                df, next_cursor = pd.DataFrame(), None
+            
+            if not df.empty:
+                # Show summary table with actual emails
+                display_df = df[['ID', 'Email', 'Readable Date', 'Download Count']]
+                st.dataframe(display_df, use_container_width=True)
+            else:
+                st.info("No emails match your search.")
+            
+            col1, col2, col3 = st.columns([1, 2, 1])
+            with col1:
+                st.button("⬅️ Previous", disabled=len(cursors) == 1, on_click=cursors.pop)
+            with col2:
+                st.caption(f"Page {len(cursors)}")
+            with col3:
+                st.button("Next ➡️", disabled=next_cursor is None,
+                          on_click=cursors.append, args=(next_cursor,))
+            
+            # Export functionality - runs as a background job, see Background Jobs below
+            st.markdown("### 📥 Export Data")
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                export_format = st.selectbox("Format", available_formats())
+            with col2:
+                export_gzip = st.checkbox("Compress (gzip)", disabled=export_format == 'Parquet')
+            with col3:
+                prepare_export = st.button("📦 Prepare export")
+            
+            if prepare_export:
+                export_gzip = export_gzip and export_format != 'Parquet'
+                submit_job('export', {'format': export_format, 'compress': export_gzip},
+                           f"{export_format} export" + (" (gzip)" if export_gzip else ""))
+            
+            # Signups and downloads over time, read from the rollup tables
+            st.markdown("### 📈 Activity Over Time")
+            col1, col2 = st.columns(2)
+            with col1:
+                granularity = st.selectbox("Granularity", list(ACTIVITY_GRANULARITIES), index=1)
+            with col2:
+                activity_window = st.selectbox("Period", ["Last 7 days", "Last 30 days", "Last 365 days", "All time"], index=1)
+            
+            activity_days = {"Last 7 days": 7, "Last 30 days": 30, "Last 365 days": 365}
+            activity_since = None
+            if activity_window in activity_days:
+                activity_since = (datetime.now() - timedelta(days=activity_days[activity_window])).isoformat()
+            
+            try:
+                activity_df = get_activity_dataframe(granularity, activity_since)
+            except Exception as e:
+                st.error(f"Database error: {e}")
+                activity_df = pd.DataFrame()
+            
+            if not activity_df.empty:
+                st.line_chart(activity_df)
+            else:
+                st.info("No activity in this period.")
+            
+            # Email domain analysis
+            st.markdown("### 📊 Email Domain Analysis")
+            col1, col2 = st.columns(2)
+            with col1:
+                top_n = st.selectbox("Top domains", [5, 10, 25, 50], index=1)
+            with col2:
+                window = st.selectbox("Time window", ["All time", "Last 24 hours", "Last 7 days", "Last 30 days", "Last 365 days"])
+            
+            window_days = {"Last 24 hours": 1, "Last 7 days": 7, "Last 30 days": 30, "Last 365 days": 365}
+            since = None
+            if window in window_days:
+                since = (datetime.now() - timedelta(days=window_days[window])).isoformat()
+            
+            try:
+                domain_counts = get_domain_counts(top_n, since)
+            except Exception as e:
+                st.error(f"Database error: {e}")
+                domain_counts = []
+            
+            if domain_counts:
+                domain_df = pd.DataFrame(domain_counts, columns=['Domain', 'Count'])
+                st.bar_chart(domain_df.set_index('Domain'))
+                st.dataframe(domain_df, use_container_width=True)
+            else:
+                st.info("No signups in this time window.")
+            
+            if st.button("📄 Full domain report"):
+                submit_job('domains', {}, "Domain report (all domains)")
+        
+        else:
+            st.info("No emails in database yet.")
+        
+        # Exports and reports run off the script thread; finished files are
+        # cached on disk until user_emails changes
+        job_ids = st.session_state.get('admin_jobs', [])
+        if job_ids:
+            st.markdown("### ⏳ Background Jobs")
+            runner = get_job_runner()
+            jobs = [job for job in map(runner.get, job_ids) if job]
+            if any(job.active for job in jobs) and hasattr(st, 'fragment'):
+                @st.fragment(run_every=JOB_POLL_SECONDS)
+                def poll_jobs():
+                    if not render_jobs(runner, job_ids):
+                        # Everything finished - one full rerun stops the polling
+                        st.rerun()
+                poll_jobs()
+            elif render_jobs(runner, job_ids):
+                st.button("🔄 Refresh job status")
+        
+        # Live process health, sampled on a background thread
+        st.markdown("### 🖥️ Server Resources")
+        if is_available('psutil'):
+            monitor = get_resource_monitor()
+            samples = list(monitor.samples) or [monitor.sample()]
+            latest = dict(zip(SAMPLE_FIELDS, samples[-1]))
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Process CPU", f"{latest['process_cpu']:.1f}%")
+                st.metric("Host CPU", f"{latest['host_cpu']:.1f}%")
+            with col2:
+                st.metric("Process RSS", f"{latest['rss_mb']:.1f} MB")
+                st.metric("Host Memory", f"{latest['host_memory']:.1f}%")
+            with col3:
+                st.metric("Open Files", latest['open_files'])
+                st.metric("Database / WAL", f"{latest['db_mb']:.1f} / {latest['wal_mb']:.1f} MB")
+            
+            if len(samples) > 1:
+                resources_df = pd.DataFrame(samples, columns=SAMPLE_FIELDS).set_index('time')
+                st.line_chart(resources_df[['rss_mb', 'wal_mb']])
+                st.line_chart(resources_df[['process_cpu', 'host_cpu']])
+            st.caption(f"One sample every {monitor.interval:g}s, last {len(samples)} kept "
+                       f"(up to {monitor.samples.maxlen}). Rerun the page to refresh.")
+            st.button("🔄 Refresh")
+        else:
+            st.info("Install psutil to see server resource usage.")
+        
+        # Where rerun time goes - collapsed so it stays out of the way
+        with st.expander("⏱️ Performance timings"):
+            profiler = get_profiler()
+            timings = profiler.snapshot()
+            if timings:
+                timings_df = pd.DataFrame(timings, columns=['Timer', 'Count', 'Mean (ms)', 'p50 (ms)',
+                                                            'p95 (ms)', 'p99 (ms)', 'Max (ms)'])
+                st.dataframe(timings_df.round(2), use_container_width=True, hide_index=True)
+                st.caption("Percentiles are histogram bucket upper bounds, shared by every session in this process.")
+                
+                timer_name = st.selectbox("Histogram", timings_df['Timer'])
+                buckets_df = pd.DataFrame(profiler.buckets(timer_name), columns=['Bucket', 'Samples'])
+                st.bar_chart(buckets_df.set_index('Bucket'))
+            else:
+                st.info("No timings recorded yet." if profiler.enabled else "Profiling is disabled (DIV_AI_PROFILING=0).")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                st.button("Reset timings", on_click=profiler.reset)
+            with col2:
+                if profiler.metrics_file and st.button("Write metrics file"):
+                    try:
+                        st.success(f"Wrote {profiler.write_metrics()}")
+                    except OSError as e:
+                        st.error(f"Could not write metrics: {e}")
+    
+    elif admin_password:
+        st.error("❌ Incorrect password!")
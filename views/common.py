@@ -0,0 +1,155 @@
+import hashlib
+import json
+import os
+
+import streamlit as st
+
+from bootstrap import bootstrap
+from content import CONTENT_VERSION, GOOGLE_DRIVE_URL, build_page_content
+from emails import upsert_email, get_write_queue
+from jobs import JobRunner
+from monitor import ResourceMonitor
+from profiling import timed
+from ratelimit import RateLimiter
+from validation import validate_email
+
+
+@st.cache_resource(show_spinner=False)
+def get_config():
+    """Load .env, config and run migrations once per server process"""
+    return bootstrap()
+
+@st.cache_data(show_spinner=False)
+def get_page_content(page, version=CONTENT_VERSION):
+    """Static page body, built once per content version"""
+    return build_page_content(page)
+
+@st.cache_resource(show_spinner=False)
+def get_email_limiter():
+    """Rate limiter shared by every session in this process"""
+    config = get_config()
+    return RateLimiter(
+        rate_per_minute=config['email_rate_per_minute'],
+        burst=config['email_burst'],
+        window_seconds=3600,
+        window_limit=config['email_hourly_limit'],
+        global_rate_per_second=config['email_global_rate'],
+    )
+
+@st.cache_resource(show_spinner=False)
+def get_resource_monitor():
+    """Resource sampler shared by every session, started on first admin view"""
+    config = get_config()
+    return ResourceMonitor(config['monitor_interval'], config['monitor_samples'])
+
+@st.cache_resource(show_spinner=False)
+def get_job_runner():
+    """Background job pool for admin exports and reports, shared by every session"""
+    config = get_config()
+    return JobRunner(config['job_workers'], config['job_dir'], config['job_max_age'])
+
+def get_client_key():
+    """Identify the visitor for rate limiting - by session unless proxies are trusted
+
+    Behind a reverse proxy st.context.ip_address is the proxy's address, so
+    keying on it would put every visitor in one bucket. With
+    DIV_AI_TRUSTED_PROXIES=N the client IP is the Nth X-Forwarded-For entry
+    from the right - the one our own outermost proxy appended, which a
+    client can't spoof by sending its own header.
+    """
+    trusted_proxies = get_config()['trusted_proxies']
+    if trusted_proxies > 0:
+        headers = getattr(getattr(st, 'context', None), 'headers', None)
+        forwarded = headers.get('X-Forwarded-For') if headers else None
+        hops = [hop.strip() for hop in forwarded.split(',')] if forwarded else []
+        if len(hops) >= trusted_proxies and hops[-trusted_proxies]:
+            return f"ip:{hops[-trusted_proxies]}"
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+    ctx = get_script_run_ctx()
+    return f"session:{ctx.session_id}" if ctx else "anonymous"
+
+def get_user_agent_hash():
+    """Short hash of the visitor's User-Agent, None if streamlit doesn't expose headers"""
+    headers = getattr(getattr(st, 'context', None), 'headers', None)
+    user_agent = headers.get('User-Agent') if headers else None
+    return hashlib.sha256(user_agent.encode()).hexdigest()[:16] if user_agent else None
+
+@timed('save_email')
+def save_email(email):
+    """Log a download for this email - written now, or queued when write-behind is on"""
+    # Reject floods before validating or touching the database
+    if not get_email_limiter().allow(get_client_key()):
+        st.error("Too many submissions - please wait a minute and try again.")
+        return False
+    if not validate_email(email):
+        st.error("Please enter a valid email address.")
+        return False
+    try:
+        write_queue = get_write_queue()
+        if write_queue:
+            write_queue.submit(email, ua_hash=get_user_agent_hash())
+        else:
+            upsert_email(email, ua_hash=get_user_agent_hash())
+        return True
+    except Exception as e:
+        st.error(f"Error saving email: {e}")
+        return False
+
+
+@st.cache_data(show_spinner=False)
+def load_manifest(path, mtime):
+    """Parsed checksum manifest, re-read whenever the file's mtime changes"""
+    with open(path) as f:
+        return json.load(f)
+
+def get_manifest():
+    """The published package manifest (manifest.py), or None if not configured"""
+    path = get_config()['manifest_path']
+    if not path:
+        return None
+    try:
+        return load_manifest(path, os.path.getmtime(path))
+    except (OSError, ValueError):
+        return None
+
+
+@st.cache_data(show_spinner=False)
+def load_delta_info(path, mtime):
+    """Summary of a published update delta, re-read whenever the file's mtime changes"""
+    from delta import read_header, summarize
+    header = read_header(path)
+    full_size, delta_size, changed, _ = summarize(header, os.path.getsize(path))
+    return {
+        'from_version': header['from_version'],
+        'to_version': header['to_version'],
+        'full_size': full_size,
+        'delta_size': delta_size,
+        'changed': changed,
+    }
+
+def get_delta_info():
+    """The published update delta (delta.py), or None unless both its file and URL are configured"""
+    config = get_config()
+    if not config['delta_path'] or not config['delta_url']:
+        return None
+    try:
+        return load_delta_info(config['delta_path'], os.path.getmtime(config['delta_path']))
+    except (OSError, ValueError):
+        return None
+
+
+@st.cache_data(show_spinner=False)
+def load_delta_tool(path, mtime):
+    """Source of delta.py, re-read whenever the file's mtime changes"""
+    with open(path, 'rb') as f:
+        return f.read()
+
+def get_delta_tool():
+    """delta.py itself, for users applying an update - the package doesn't include it"""
+    import delta
+    return load_delta_tool(delta.__file__, os.path.getmtime(delta.__file__))
+
+
+def create_download_link():
+    """Create secure download link - the self-hosted server when configured"""
+    return get_config()['download_url'] or GOOGLE_DRIVE_URL
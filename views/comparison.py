@@ -0,0 +1,31 @@
+import streamlit as st
+
+from views.common import get_page_content
+
+
+def render():
+    """Comparison page"""
+    content = get_page_content("Comparison")
+    st.markdown("## DIV-AI vs Competition")
+    
+    st.markdown("### See how DIV-AI stacks up against popular AI assistants:")
+    
+    st.markdown("""
+    <div class="comparison-table">
+    """, unsafe_allow_html=True)
+    
+    st.dataframe(content['table'], use_container_width=True)
+    
+    st.markdown("</div>", unsafe_allow_html=True)
+    
+    st.markdown("### Why DIV-AI Wins:")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown(content['privacy'])
+        st.markdown(content['cost'])
+    
+    with col2:
+        st.markdown(content['performance'])
+        st.markdown(content['business'])
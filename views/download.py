@@ -0,0 +1,89 @@
+import json
+import os
+
+import streamlit as st
+
+from content import GOOGLE_DRIVE_URL
+from views.common import (create_download_link, get_config, get_delta_info, get_delta_tool, get_manifest,
+                          get_page_content)
+
+
+def render():
+    """Download page"""
+    content = get_page_content("Download")
+    download_url = create_download_link()
+    from_drive = download_url == GOOGLE_DRIVE_URL
+    st.markdown("## Download DIV-AI")
+    
+    st.markdown(content['banner'], unsafe_allow_html=True)
+    
+    # Download link OUTSIDE the form (only show after email verification)
+    package_card = content['package_card'].format(
+        download_url=download_url,
+        download_label="Download DIV-AI from Google Drive" if from_drive else "Download DIV-AI",
+    )
+    st.markdown(package_card, unsafe_allow_html=True)
+        
+    if from_drive:
+        st.info("**Download link is now available!** Click the button above to download from Google Drive.")
+    else:
+        st.info("**Download link is now available!** Click the button above to start the download.")
+        
+    # Installation instructions
+    st.markdown("### Quick Installation")
+    st.markdown(content['installation'] if from_drive else content['installation_direct'])
+        
+    st.markdown("### Download Instructions")
+    st.markdown(content['instructions'] if from_drive else content['instructions_direct'])
+    
+    # Update delta for the previous release, when one has been published with delta.py
+    delta = get_delta_info()
+    if delta:
+        st.markdown(f"### ⚡ Update From {delta['from_version']}")
+        st.markdown(content['update'].format(
+            from_version=delta['from_version'],
+            to_version=delta['to_version'],
+            delta_mb=delta['delta_size'] / 1024 / 1024,
+            full_mb=delta['full_size'] / 1024 / 1024,
+        ))
+        saved = 100 - delta['delta_size'] * 100 / max(delta['full_size'], 1)
+        st.link_button(f"Download update ({saved:.0f}% smaller)", get_config()['delta_url'])
+        st.download_button(
+            label="🛠️ Download delta.py",
+            data=get_delta_tool(),
+            file_name="delta.py",
+            mime="text/x-python"
+        )
+    
+    # Checksum manifest, when one has been published with manifest.py
+    manifest = get_manifest()
+    if manifest:
+        st.markdown("### 🔐 Verify Your Download")
+        st.markdown(content['verify'])
+        for entry in manifest['files']:
+            st.markdown(f"**{entry['name']}** - {entry['size']:,} bytes, "
+                        f"{len(entry['chunks'])} chunks of {manifest['chunk_size'] // 1024 // 1024}MB")
+            st.code(f"Merkle root: {entry['merkle_root']}", language=None)
+        st.download_button(
+            label="📄 Download checksum manifest",
+            data=json.dumps(manifest, indent=2),
+            file_name=os.path.basename(get_config()['manifest_path']),
+            mime="application/json"
+        )
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.markdown("### What You Get After Download")
+        st.markdown(content['cards'], unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("### Download Benefits")
+        st.markdown(content['benefits'])
+        
+        st.markdown("### Secure Download")
+        st.markdown(content['secure'])
+    
+    st.markdown("---")
+    st.markdown("### Important Notes")
+    st.warning(content['notes'])
@@ -0,0 +1,19 @@
+import streamlit as st
+
+from views.common import get_page_content
+
+
+def render():
+    """FAQ page"""
+    content = get_page_content("FAQ")
+    st.markdown("## Frequently Asked Questions")
+    
+    for category, questions in content['faqs'].items():
+        st.markdown(f"### {category}")
+        for question, answer in questions:
+            with st.expander(question):
+                st.write(answer)
+        st.markdown("---")
+    
+    st.markdown("### Still Have Questions?")
+    st.markdown(content['contact'])
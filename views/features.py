@@ -0,0 +1,23 @@
+import streamlit as st
+
+from views.common import get_page_content
+
+
+def render():
+    """Features page"""
+    content = get_page_content("Features")
+    st.markdown("## Powerful Features")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown(content['capabilities'])
+        st.markdown(content['interface'])
+    
+    with col2:
+        st.markdown(content['technical'])
+        st.markdown(content['customization'])
+    
+    st.markdown("---")
+    st.markdown("### What Makes DIV-AI Special?")
+    st.markdown(content['cards'], unsafe_allow_html=True)
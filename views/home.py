@@ -0,0 +1,22 @@
+import streamlit as st
+
+from views.common import get_page_content
+
+
+def render():
+    """Home page"""
+    content = get_page_content("Home")
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.markdown(content['title'])
+        st.markdown(content['note'])
+        st.markdown(content['intro'])
+        st.markdown(content['cards'], unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("### Quick Stats")
+        st.markdown(content['stats'], unsafe_allow_html=True)
+        
+        st.markdown("### Perfect For:")
+        st.markdown(content['perfect_for'])
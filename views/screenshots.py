@@ -0,0 +1,26 @@
+import streamlit as st
+
+from views.common import get_page_content
+
+
+def render():
+    """Screenshots page"""
+    content = get_page_content("Screenshots")
+    st.markdown("## See DIV-AI in Action")
+    
+    st.markdown("### Clean, Professional Interface")
+    st.info("**Note**: Screenshots show the actual DIV-AI interface - clean, fast, and user-friendly!")
+    
+    # Placeholder for screenshots (you would replace with actual images)
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("#### Main Interface")
+        st.markdown(content['main_interface'])
+    
+    with col2:
+        st.markdown("#### Quick Questions Feature")
+        st.markdown(content['quick_questions'])
+    
+    st.markdown("### Key Interface Features")
+    st.markdown(content['cards'], unsafe_allow_html=True)
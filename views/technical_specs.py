@@ -0,0 +1,30 @@
+import streamlit as st
+
+from views.common import get_page_content
+
+
+def render():
+    """Technical Specs page"""
+    content = get_page_content("Technical Specs")
+    st.markdown("## Technical Specifications")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### System Requirements")
+        st.markdown(content['requirements'])
+        
+        st.markdown("### What's Included")
+        st.markdown(content['included'])
+    
+    with col2:
+        st.markdown("### AI Model Details")
+        st.markdown(content['model'])
+        
+        st.markdown("### Performance Metrics")
+        st.markdown(content['performance'])
+    
+    st.markdown("---")
+    
+    st.markdown("### Technical Architecture")
+    st.markdown(content['cards'], unsafe_allow_html=True)